@@ -5,12 +5,15 @@ setting of the experiment configuration settings.
 """
 
 import copy
+import logging
 import multiprocessing
-from typing import Dict, List, Optional, Union
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from functools import partial
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
-import customshowme
 import networkx as nx
-from simsnn.core.simulators import Simulator
 from snnalgorithms.get_input_graphs import (
     create_mdsa_input_graphs_from_exp_config,
 )
@@ -22,7 +25,6 @@ from snncompare.exp_config.Exp_config import (
     Exp_config,
     Supported_experiment_settings,
 )
-from snncompare.export_plots.create_dash_plot import create_svg_plot
 from snncompare.export_plots.Plot_config import (
     Plot_config,
     get_default_plot_config,
@@ -39,6 +41,9 @@ from snncompare.export_results.analysis.create_performance_plots import (
     create_performance_plots,
     get_completed_and_missing_run_configs,
 )
+from snncompare.export_results.export_json_results import (
+    set_shared_file_lock,
+)
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     output_stage_1_configs_and_input_graphs,
 )
@@ -62,14 +67,19 @@ from snncompare.optional_config.Output_config import (
     Output_config,
     Zoom,
 )
+from snncompare.optional_decorators import time_if_profiling
 from snncompare.process_results.get_failure_modes import (
     add_failure_modes_to_graph,
 )
-from snncompare.process_results.show_failure_modes import show_failures
 from snncompare.progress_report.has_completed_stage2_or_4 import (
     assert_has_outputted_stage_2_or_4,
     has_outputted_stage_2_or_4,
 )
+from snncompare.progress_report.run_checkpoint import (
+    get_run_configs_to_perform,
+    load_completed_run_config_ids,
+    store_completed_run_config_ids,
+)
 from snncompare.run_config.Run_config import Run_config
 from snncompare.simulation.add_radiation_graphs import (
     ensure_empty_rad_snns_exist,
@@ -84,6 +94,25 @@ from .graph_generation.stage_1_create_graphs import (
 from .process_results.process_results import set_results
 from .simulation.stage2_sim import sim_graphs
 
+if TYPE_CHECKING:
+    from simsnn.core.simulators import Simulator
+
+logger = logging.getLogger(__name__)
+
+
+@typechecked
+def get_process_pool_context() -> Optional[BaseContext]:
+    """Returns the fork multiprocessing context if the platform supports it,
+    and None (the default start method) otherwise.
+
+    Forked worker processes inherit the already imported modules,
+    instead of importing the whole package again as spawned processes
+    do. Windows does not support fork, so it falls back to spawn.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
 
 class Experiment_runner:
     """Experiment manager.
@@ -107,6 +136,9 @@ class Experiment_runner:
         # Ensure output directories are created for stages 1 to 4.
         create_root_dir_if_not_exists(root_dir_name="results")
 
+        # The names of the graphs of a run, which are plotted in stage 3.
+        self.snn_graph_names: List[str] = get_snn_graph_names()
+
         output_config.hover_info = create_default_hover_info(
             exp_config=exp_config
         )
@@ -143,6 +175,12 @@ class Experiment_runner:
             plot_raw_adap_cost_datas(exp_config=self.exp_config)
 
         if output_config.extra_storing_config.show_failure_modes:
+            # Only import dash when the failure modes are shown.
+            # pylint: disable=C0415
+            from snncompare.process_results.show_failure_modes import (
+                show_failures,
+            )
+
             show_failures(
                 exp_config=self.exp_config, run_configs=self.run_configs
             )
@@ -162,44 +200,178 @@ class Experiment_runner:
         """
         plot_config = get_default_plot_config()
         results_nx_graphs: Dict
+
+        completed_run_config_ids: List[str] = load_completed_run_config_ids(
+            exp_config=exp_config
+        )
+        run_configs = get_run_configs_to_perform(
+            completed_run_config_ids=completed_run_config_ids,
+            output_config=output_config,
+            run_configs=run_configs,
+        )
+
+        if self.performs_runs_in_parallel(
+            output_config=output_config, run_configs=run_configs
+        ):
+            max_workers: int = min(
+                output_config.parallel_runs or 1, len(run_configs)
+            )
+            mp_context: Optional[BaseContext] = get_process_pool_context()
+            # Lets the workers append to the shared seed hash files one at a
+            # time.
+            shared_file_lock = (
+                mp_context or multiprocessing.get_context()
+            ).Lock()
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=mp_context,
+                initializer=partial(
+                    set_shared_file_lock, lock=shared_file_lock
+                ),
+            ) as executor:
+                run_futures: Dict[Future, Run_config] = {
+                    executor.submit(
+                        perform_run_in_worker,
+                        run_config,
+                        exp_config=exp_config,
+                        output_config=output_config,
+                        plot_config=plot_config,
+                    ): run_config
+                    for run_config in run_configs
+                }
+                # Checkpoint each run as soon as it finishes, such that an
+                # interrupted sweep can still skip the completed runs.
+                failed_run_config_ids: List[str] = []
+                for run_future in as_completed(run_futures):
+                    run_config = run_futures[run_future]
+                    try:
+                        run_future.result()
+                    # pylint: disable=W0703
+                    except Exception:
+                        logger.exception(
+                            "Run config:%s failed.", run_config.unique_id
+                        )
+                        failed_run_config_ids.append(run_config.unique_id)
+                        continue
+                    self.store_run_completion(
+                        completed_run_config_ids=completed_run_config_ids,
+                        exp_config=exp_config,
+                        run_config=run_config,
+                    )
+            # Only raise after the other runs are checkpointed, such that a
+            # resumed experiment does not redo them.
+            if failed_run_config_ids:
+                raise RuntimeError(
+                    f"Error, the run configs:{failed_run_config_ids} failed."
+                )
+            return
+
         for i, run_config in enumerate(run_configs):
             print(f"\n{i+1}/{len(run_configs)} [runs]")
-            run_config.print_run_config_dict()
-            results_nx_graphs = self.perform_run_stage_1(
+            results_nx_graphs = self.perform_single_run(
+                run_config,
                 exp_config=exp_config,
                 output_config=output_config,
                 plot_config=plot_config,
-                run_config=run_config,
-            )
-
-            results_nx_graphs = self.__perform_run_stage_2(
-                results_nx_graphs=results_nx_graphs,
-                output_config=output_config,
-                run_config=run_config,
             )
-
-            self.__perform_run_stage_3(
+            # Store run results in dict of Experiment_runner.
+            self.results_nx_graphs: Dict = {
+                run_config.unique_id: results_nx_graphs  # type:ignore[index]
+            }
+            self.store_run_completion(
+                completed_run_config_ids=completed_run_config_ids,
                 exp_config=exp_config,
-                output_config=output_config,
-                results_nx_graphs=results_nx_graphs,
                 run_config=run_config,
             )
 
-            self.__perform_run_stage_4(
+    @typechecked
+    def store_run_completion(
+        self,
+        completed_run_config_ids: List[str],
+        exp_config: Exp_config,
+        run_config: Run_config,
+    ) -> None:
+        """Adds the run config to the completed run configs of the experiment
+        and updates the checkpoint, such that an interrupted experiment can
+        skip it when it is resumed.
+
+        The checkpoint is always written, also without
+        --skip-completed-runs, such that any interrupted experiment can
+        be resumed with that flag.
+        """
+        if run_config.unique_id not in completed_run_config_ids:
+            completed_run_config_ids.append(run_config.unique_id)
+            store_completed_run_config_ids(
+                completed_run_config_ids=completed_run_config_ids,
                 exp_config=exp_config,
-                output_config=output_config,
-                results_nx_graphs=results_nx_graphs,
-                run_config=run_config,
             )
-            # Store run results in dict of Experiment_runner.
-            self.results_nx_graphs: Dict = {
-                run_config.unique_id: results_nx_graphs  # type:ignore[index]
-            }
 
-    @customshowme.time
     @typechecked
-    def perform_run_stage_1(
+    def performs_runs_in_parallel(
+        self,
+        output_config: Output_config,
+        run_configs: List[Run_config],
+    ) -> bool:
+        """Returns True if the runs are distributed over worker processes.
+
+        Stage 3 shows the dash plots and waits for user input, so the
+        runs are performed serially if images are exported.
+        """
+        return (
+            output_config.parallel_runs is not None
+            and output_config.parallel_runs > 1
+            and len(run_configs) > 1
+            and not output_config.export_types
+        )
+
+    @typechecked
+    def perform_single_run(
         self,
+        run_config: Run_config,
+        exp_config: Exp_config,
+        output_config: Output_config,
+        plot_config: Plot_config,
+    ) -> Dict:
+        """Performs the 4 stages of a single run configuration and returns its
+        results_nx_graphs dict.
+
+        Runs that are performed in parallel use perform_run_in_worker
+        instead, which does not need the Experiment_runner.
+        """
+        if output_config.verbose:
+            run_config.print_run_config_dict()
+        results_nx_graphs: Dict = self.perform_run_stage_1(
+            exp_config=exp_config,
+            output_config=output_config,
+            plot_config=plot_config,
+            run_config=run_config,
+        )
+
+        results_nx_graphs = self.perform_run_stage_2(
+            results_nx_graphs=results_nx_graphs,
+            output_config=output_config,
+            run_config=run_config,
+        )
+
+        self.__perform_run_stage_3(
+            exp_config=exp_config,
+            output_config=output_config,
+            results_nx_graphs=results_nx_graphs,
+            run_config=run_config,
+        )
+
+        self.perform_run_stage_4(
+            exp_config=exp_config,
+            output_config=output_config,
+            results_nx_graphs=results_nx_graphs,
+            run_config=run_config,
+        )
+        return results_nx_graphs
+
+    @staticmethod
+    @time_if_profiling
+    @typechecked
+    def perform_run_stage_1(
         exp_config: Exp_config,
         output_config: Output_config,
         plot_config: Plot_config,
@@ -219,10 +391,11 @@ class Experiment_runner:
 
         add_stage_completion_to_graph(snn=input_graph, stage_index=1)
 
+        graphs_dict: Dict = {"input_graph": input_graph}
         results_nx_graphs = {
             "exp_config": exp_config,
             "run_config": run_config,
-            "graphs_dict": {"input_graph": input_graph},
+            "graphs_dict": graphs_dict,
         }
 
         # Check if stage 1 is performed. If not, perform it.
@@ -235,7 +408,7 @@ class Experiment_runner:
         ):
             # Run first stage of experiment, get input graph.
             stage_1_graphs: Dict[
-                str, Union[nx.Graph, nx.DiGraph, Simulator]
+                str, Union[nx.Graph, nx.DiGraph, "Simulator"]
             ] = get_graphs_stage_1(
                 plot_config=plot_config, run_config=run_config
             )
@@ -249,20 +422,20 @@ class Experiment_runner:
             output_stage_1_configs_and_input_graphs(
                 exp_config=exp_config,
                 run_config=run_config,
-                graphs_dict=results_nx_graphs["graphs_dict"],
+                graphs_dict=stage_1_graphs,
             )
 
             for with_adaptation in [False, True]:
                 output_stage_1_snns(
                     run_config=run_config,
-                    graphs_dict=results_nx_graphs["graphs_dict"],
+                    graphs_dict=stage_1_graphs,
                     with_adaptation=with_adaptation,
                 )
 
         else:
             results_nx_graphs["graphs_dict"] = load_stage1_simsnn_graphs(
                 run_config=run_config,
-                stage_1_graphs_dict=results_nx_graphs["graphs_dict"],
+                stage_1_graphs_dict=graphs_dict,
             )
 
             # self.equalise_loaded_run_config(
@@ -273,10 +446,10 @@ class Experiment_runner:
         assert_has_outputted_stage_1(run_config=run_config)
         return results_nx_graphs
 
-    @customshowme.time
+    @staticmethod
+    @time_if_profiling
     @typechecked
-    def __perform_run_stage_2(
-        self,
+    def perform_run_stage_2(
         output_config: Output_config,
         results_nx_graphs: Dict,
         run_config: Run_config,
@@ -288,6 +461,8 @@ class Experiment_runner:
         exports each timestep of those SNN graphs to a json dictionary.
         """
 
+        graphs_dict: Dict = results_nx_graphs["graphs_dict"]
+
         # Verify incoming results dict.
         if run_config.simulator == "nx":
             verify_results_nx_graphs(
@@ -296,19 +471,19 @@ class Experiment_runner:
 
         ensure_empty_rad_snns_exist(
             run_config=run_config,
-            stage_1_graphs=results_nx_graphs["graphs_dict"],
+            stage_1_graphs=graphs_dict,
         )
 
         # Run simulation on networkx or lava backend.
         sim_graphs(
             output_config=output_config,
             run_config=run_config,
-            stage_1_graphs=results_nx_graphs["graphs_dict"],
+            stage_1_graphs=graphs_dict,
         )
 
         # TODO: include check to se if stage 2 output is skipped.
         output_stage_2_snns(
-            graphs_dict=results_nx_graphs["graphs_dict"],
+            graphs_dict=graphs_dict,
             output_config=output_config,
             run_config=run_config,
         )
@@ -337,7 +512,13 @@ class Experiment_runner:
         - A circular synapse: a recurrent connection of a neuron into itself.
         """
         if output_config.export_types:
-            if "hover_info" not in output_config.__dict__.keys():
+            # Only import plotly and dash when the plots are created.
+            # pylint: disable=C0415
+            from snncompare.export_plots.create_dash_plot import (
+                create_svg_plot,
+            )
+
+            if "hover_info" not in output_config.__dict__:
                 output_config = create_default_output_config(
                     exp_config=exp_config,
                 )
@@ -354,20 +535,25 @@ class Experiment_runner:
                 "vth",
             ]
 
-            # Generate Dash plots using multiprocessing.
-            jobs = []
-            for i, graph_name in enumerate(get_snn_graph_names()):
+            # Generate Dash plots in separate processes. Forked processes
+            # inherit the graphs, instead of receiving a pickled copy.
+            process_context: BaseContext = (
+                get_process_pool_context() or multiprocessing.get_context()
+            )
+            graphs_dict: Dict = results_nx_graphs["graphs_dict"]
+            jobs: List[BaseProcess] = []
+            for i, graph_name in enumerate(self.snn_graph_names):
                 if output_config.dash_port is None:
                     output_config.dash_port = 8050 + i
                 else:
                     output_config.dash_port += i
 
                 if graph_name in output_config.graph_types:
-                    p = multiprocessing.Process(
+                    p = process_context.Process(  # type:ignore[attr-defined]
                         target=create_svg_plot,
                         args=(
                             [graph_name],
-                            results_nx_graphs["graphs_dict"],
+                            graphs_dict,
                             output_config,
                             run_config,
                         ),
@@ -376,12 +562,17 @@ class Experiment_runner:
                     p.start()
             for proc in jobs:
                 proc.join()
+                if proc.exitcode != 0:
+                    raise ChildProcessError(
+                        f"Error, plotting {proc.name} of run config:"
+                        + f"{run_config.unique_id} failed."
+                    )
             input("Proceeding to next visualisation.")
 
-    @customshowme.time
+    @staticmethod
+    @time_if_profiling
     @typechecked
-    def __perform_run_stage_4(
-        self,
+    def perform_run_stage_4(
         exp_config: Exp_config,
         output_config: Output_config,
         results_nx_graphs: Dict,
@@ -393,10 +584,11 @@ class Experiment_runner:
         default/Neumann implementation. Then stores this result in the
         last entry of each graph.
         """
+        graphs_dict: Dict = results_nx_graphs["graphs_dict"]
 
         if (
             not has_outputted_stage_2_or_4(
-                graphs_dict=results_nx_graphs["graphs_dict"],
+                graphs_dict=graphs_dict,
                 run_config=run_config,
                 stage_index=4,
             )
@@ -406,7 +598,7 @@ class Experiment_runner:
                 exp_config=exp_config,
                 output_config=output_config,
                 run_config=run_config,
-                stage_2_graphs=results_nx_graphs["graphs_dict"],
+                stage_2_graphs=graphs_dict,
             )
 
             output_data_types = ["results"]
@@ -417,7 +609,7 @@ class Experiment_runner:
 
                 # Set failure modes.
                 add_failure_modes_to_graph(
-                    snn_graphs=results_nx_graphs["graphs_dict"],
+                    snn_graphs=graphs_dict,
                     run_config=run_config,
                 )
 
@@ -429,12 +621,12 @@ class Experiment_runner:
                 output_snn_results(
                     output_data_type=output_data_type,
                     run_config=run_config,
-                    graphs_dict=results_nx_graphs["graphs_dict"],
+                    graphs_dict=graphs_dict,
                     stage_index=stage_index,
                 )
 
             assert_has_outputted_stage_2_or_4(
-                graphs_dict=results_nx_graphs["graphs_dict"],
+                graphs_dict=graphs_dict,
                 run_config=run_config,
                 stage_index=4,
             )
@@ -477,9 +669,9 @@ class Experiment_runner:
                 bottom_top=None,
             ),
             output_json_stages=[1, 2, 4],
-            extra_storing_config=copy.deepcopy(
-                output_config.extra_storing_config
-            ),
+            # The extra storing config only contains booleans, so a shallow
+            # copy is independent of the original.
+            extra_storing_config=copy.copy(output_config.extra_storing_config),
         )
 
         # Generate the data/run the experiments for the missing run_configs.
@@ -498,3 +690,41 @@ class Experiment_runner:
             run_configs=run_configs,
             filepath=pickle_run_configs_filepath,
         )
+
+
+@typechecked
+def perform_run_in_worker(
+    run_config: Run_config,
+    exp_config: Exp_config,
+    output_config: Output_config,
+    plot_config: Plot_config,
+) -> str:
+    """Performs stages 1, 2 and 4 of a single run configuration in a worker
+    process and returns the unique id of the run config.
+
+    Only the configs are sent to the worker, instead of the whole
+    Experiment_runner. The results are stored in the output files, so
+    the graphs, including their Simulator objects, are not sent back to
+    the parent process. Stage 3 is skipped, because runs are only
+    performed in parallel if no images are exported.
+    """
+    if output_config.verbose:
+        run_config.print_run_config_dict()
+    results_nx_graphs: Dict = Experiment_runner.perform_run_stage_1(
+        exp_config=exp_config,
+        output_config=output_config,
+        plot_config=plot_config,
+        run_config=run_config,
+    )
+    results_nx_graphs = Experiment_runner.perform_run_stage_2(
+        results_nx_graphs=results_nx_graphs,
+        output_config=output_config,
+        run_config=run_config,
+    )
+    Experiment_runner.perform_run_stage_4(
+        exp_config=exp_config,
+        output_config=output_config,
+        results_nx_graphs=results_nx_graphs,
+        run_config=run_config,
+    )
+    return run_config.unique_id
@@ -346,6 +346,40 @@ def parse_cli_args(
         help=("Show dash app in browser on 127:0.0.1:<port>"),
     )
 
+    parser.add_argument(
+        "-pr",
+        "--parallel-runs",
+        action="store",
+        type=int,
+        dest="parallel_runs",
+        help=(
+            "Perform the run configurations in parallel on <parallel_runs> "
+            + "worker processes. Runs are performed serially if images are "
+            + "exported."
+        ),
+    )
+
+    parser.add_argument(
+        "-scr",
+        "--skip-completed-runs",
+        action="store_true",
+        default=False,
+        help=(
+            "Skip the run configurations that were completed in a previous, "
+            + "possibly interrupted, run of the same experiment config. The "
+            + "completed run configurations are always recorded. They are "
+            + "not skipped if stages are recreated or images are exported."
+        ),
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        default=False,
+        help="Print the run configuration of each run.",
+    )
+
     # Ensure SNN behaviour visualisation in stage 3 is exported to images.
     parser.add_argument(
         "-z",
@@ -9,7 +9,7 @@ def convert_csv_list_arg_to_list(
     """Splits a csv list into a list of strings."""
     return_list: List[str] = []
     if arg_val is not None:
-        if isinstance(arg_val, List):
+        if isinstance(arg_val, list):
             for elem in arg_val:
                 return_list.append(str(elem))
         elif isinstance(arg_val, str):
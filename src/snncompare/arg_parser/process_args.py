@@ -8,7 +8,6 @@ from typeguard import typechecked
 
 from snncompare.arg_parser.helper import convert_csv_list_arg_to_list
 from snncompare.exp_config.Exp_config import Exp_config
-from snncompare.Experiment_runner import Experiment_runner
 from snncompare.export_plots.plot_graphs import create_root_dir_if_not_exists
 from snncompare.helper import get_snn_graph_names
 from snncompare.optional_config.Output_config import (
@@ -65,6 +64,12 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
 
     output_config: Output_config = manage_export_parsing(args=args)
 
+    # Import the experiment runner (and the simulation and plotting stack it
+    # depends on) only once it is used, such that e.g. --help and invalid
+    # arguments do not pay for those imports.
+    # pylint: disable=C0415
+    from snncompare.Experiment_runner import Experiment_runner
+
     # python -m src.snncompare -e mdsa_creation_only_size_3_4 -v
     Experiment_runner(
         exp_config=exp_config,
@@ -83,7 +88,6 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
 @typechecked
 def manage_export_parsing(*, args: argparse.Namespace) -> Output_config:
     """Performs the argument parsing related to data export settings."""
-    create_root_dir_if_not_exists(root_dir_name="latex/Images/graphs")
     optional_config_args_dict = {}
     extra_storing_config_dict = {}
 
@@ -93,6 +97,10 @@ def manage_export_parsing(*, args: argparse.Namespace) -> Output_config:
     if args.delete_results and os.path.exists("results"):
         shutil.rmtree("results")
 
+    # Create the image directory after the optional deletion, such that it
+    # also exists after the images are deleted.
+    create_root_dir_if_not_exists(root_dir_name="latex/Images/graphs")
+
     # To show figures, they need to be (created), (and hence) exported.
     if args.show_images:
         if args.export_images is None:
@@ -144,6 +152,10 @@ def manage_export_parsing(*, args: argparse.Namespace) -> Output_config:
             "Error, port nr should be >8000. Not necessarily over 9000."
         )
 
+    optional_config_args_dict["parallel_runs"] = args.parallel_runs
+    optional_config_args_dict["skip_completed_runs"] = args.skip_completed_runs
+    optional_config_args_dict["verbose"] = args.verbose
+
     optional_config_args_dict["zoom"] = parse_zoom_arg(args=args)
     optional_config_args_dict["recreate_stages"] = parse_recreate_stages(
         args=args
@@ -60,10 +60,7 @@ def add_generic_exp_config_rad_dict(
             for inhibitory in rad_settings["inhibitory"]:
                 if excitatory or inhibitory:
                     for probability_per_t in rad_settings["probability_per_t"]:
-                        if (
-                            "nr_of_synaptic_weight_increases"
-                            in rad_settings.keys()
-                        ):
+                        if "nr_of_synaptic_weight_increases" in rad_settings:
                             for nswi in rad_settings[
                                 "nr_of_synaptic_weight_increases"
                             ]:
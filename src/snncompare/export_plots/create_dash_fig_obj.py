@@ -1,15 +1,16 @@
 """Generates a graph in dash."""
 
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import networkx as nx
 import numpy as np
 import plotly.graph_objs as go
-from plotly.graph_objs.layout import Annotation
 from typeguard import typechecked
 
 from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.optional_decorators import typechecked_debug
 
 
 # pylint: disable=R0903
@@ -23,7 +24,9 @@ class NamedAnnotation:
         node_name: Optional[str] = None,
         **kwargs: Any,
     ):
-        self.annotation = Annotation(**kwargs)
+        # Plotly validates the annotation properties once, when the figure is
+        # created, so store them as a plain dict.
+        self.annotation: Dict = kwargs
         self.edge: Union[Tuple[str, str], None] = edge
         self.node_name: Union[str, None] = node_name
         self.category: str = category
@@ -47,40 +50,59 @@ def create_svg_with_dash(
     plot_config: Plot_config,
 ) -> Tuple[go.Figure, List[NamedAnnotation]]:
     """Creates an .svg plot of the incoming networkx graph."""
-    pixel_width: int = int(plot_config.base_pixel_width * xy_max(G=graph)[0])
-    pixel_height: int = int(plot_config.base_pixel_height * xy_max(G=graph)[1])
     recursive_edge_radius = plot_config.recursive_edge_radius
 
+    # Collect the node properties in a single pass over the nodes.
+    positions: List[Tuple[float, ...]] = []
+    xs: List[float] = []
+    ys: List[float] = []
+    labels: List[str] = []
+    hovertexts: List[str] = []
+    colours: List[str] = []
+    for node_name, node_attributes in graph.nodes(data=True):
+        if node_attributes["pos"] is None:
+            raise ValueError(f"Error, pos:{node_name} is None.")
+        positions.append(tuple(node_attributes["pos"]))
+        xs.append(node_attributes["pos"][0])
+        ys.append(node_attributes["pos"][1])
+        if plot_config.show_node_labels:
+            labels.append(node_attributes["label"])
+        hovertexts.append(f'{node_attributes["temporal_node_hovertext"][0]}')
+        if plot_config.show_node_colours:
+            colours.append(node_attributes["colour"])
+
     # Create nodes
     node_trace = go.Scatter(
-        x=list(graph.nodes[n]["pos"][0] for n in graph.nodes()),
-        y=list(graph.nodes[n]["pos"][1] for n in graph.nodes()),
-        text=list(graph.nodes[n]["label"] for n in graph.nodes())
-        if plot_config.show_node_labels
-        else None,
+        x=xs,
+        y=ys,
+        text=labels if plot_config.show_node_labels else None,
         mode="markers+text",
-        hovertext=list(
-            f'{graph.nodes[n]["temporal_node_hovertext"][0]}'
-            for i, n in enumerate(graph.nodes())
-        ),
+        hovertext=hovertexts,
         hoverinfo="text",
         # hoverinfo="name+x+text",
         marker={
             "size": plot_config.node_size,
-            "color": list(graph.nodes[n]["colour"] for n in graph.nodes())
-            if plot_config.show_node_colours
-            else None,
+            "color": colours if plot_config.show_node_colours else None,
         },
         textfont={"size": plot_config.neuron_text_size},
     )
 
+    # The node positions and edges are the same in every timestep, so the
+    # layout is only computed for the first figure of a plotted graph.
+    static_layout: Dict = get_static_layout(
+        base_pixel_height=plot_config.base_pixel_height,
+        base_pixel_width=plot_config.base_pixel_width,
+        edges=tuple(graph.edges),
+        node_names=tuple(graph.nodes),
+        positions=tuple(positions),
+    )
+
     # Create figure
     identified_annotations = get_annotations(
         G=graph,
-        pixel_height=pixel_height,
-        pixel_width=pixel_width,
         plot_config=plot_config,
         recursive_edge_radius=plot_config.recursive_edge_radius,
+        static_layout=static_layout,
     )
     add_ticks_to_snn_graph(
         is_x_tick=plot_config.show_x_ticks,
@@ -110,41 +132,46 @@ def create_svg_with_dash(
     fig = go.Figure(
         data=[node_trace],
         layout=go.Layout(
-            height=pixel_height,  # height of image in pixels.
-            width=pixel_width,  # Width of image in pixels.
-            annotations=list(
-                map(lambda x: x.annotation, identified_annotations)
+            height=static_layout["pixel_height"],  # Height in pixels.
+            width=static_layout["pixel_width"],  # Width of image in pixels.
+            annotations=[
+                identified_annotation.annotation
+                for identified_annotation in identified_annotations
+            ],
+            shapes=get_recursive_edge_shapes(
+                G=graph,
+                plot_config=plot_config,
+                radius=recursive_edge_radius,
             ),
             xaxis=x_axis,
             yaxis=y_axis,
         ),
     )
-
-    add_recursive_edges(
-        G=graph,
-        fig=fig,
-        plot_config=plot_config,
-        radius=recursive_edge_radius,
-    )
     return fig, identified_annotations
 
 
 @typechecked
 def get_annotations(
     G: nx.DiGraph,
-    pixel_height: int,
-    pixel_width: int,
     plot_config: Plot_config,
     recursive_edge_radius: float,
+    static_layout: Dict,
 ) -> List[NamedAnnotation]:
     """Returns the annotations for this graph."""
     annotations: List[NamedAnnotation] = []
-    annotations.extend(get_regular_edge_arrows(G=G, plot_config=plot_config))
+    annotations.extend(
+        get_regular_edge_arrows(
+            G=G,
+            left_xys=static_layout["left_xys"],
+            plot_config=plot_config,
+            right_xys=static_layout["right_xys"],
+        )
+    )
     annotations.extend(
         get_regular_and_recursive_edge_labels(
             G=G,
-            pixel_height=pixel_height,
-            pixel_width=pixel_width,
+            angles=static_layout["angles"],
+            mid_points=static_layout["mid_points"],
             plot_config=plot_config,
             radius=recursive_edge_radius,
         )
@@ -153,62 +180,103 @@ def get_annotations(
     return annotations
 
 
+@lru_cache(maxsize=32)
 @typechecked
-def xy_max(
+def get_static_layout(
     *,
-    G: nx.DiGraph,
-) -> Tuple[float, float]:
-    """Computes the max x- and y-positions found in the nodes."""
-    positions: List[Tuple[float, float]] = []
-    for node_name in G.nodes():
-        if G.nodes[node_name]["pos"] is None:
-            raise ValueError(f"Error, pos:{node_name} is None.")
-        positions.append(G.nodes[node_name]["pos"])
+    base_pixel_height: int,
+    base_pixel_width: int,
+    edges: Tuple[Tuple[str, str], ...],
+    node_names: Tuple[str, ...],
+    positions: Tuple[Tuple[float, ...], ...],
+) -> Dict:
+    """Returns the pixel height and width of the figure, and the coordinates,
+    mid points and label angles of the edges, in the order of the edges.
+
+    These only depend on the node positions and edges of the plotted
+    graph, which do not change between timesteps, so they are cached.
+    The returned dict is shared between the figures of a plotted graph
+    and should not be modified.
+    """
+    xy_positions: np.ndarray = np.asarray(positions, dtype=float).reshape(
+        -1, 2
+    )
+    max_x, max_y = np.max(xy_positions, axis=0)
+    pixel_width: int = int(base_pixel_width * max_x)
+    pixel_height: int = int(base_pixel_height * max_y)
 
-    x = max(list(map(lambda a: a[0], positions)))
-    y = max(list(map(lambda a: a[1], positions)))
-    return x, y
+    left_xys, right_xys = get_edge_coordinates(
+        edges=edges, node_names=node_names, positions=xy_positions
+    )
+    return {
+        "pixel_height": pixel_height,
+        "pixel_width": pixel_width,
+        "left_xys": left_xys.tolist(),
+        "right_xys": right_xys.tolist(),
+        "mid_points": ((left_xys + right_xys) / 2).tolist(),
+        "angles": get_stretched_edge_angles(
+            left_xys=left_xys,
+            right_xys=right_xys,
+            pixel_height=pixel_height,
+            pixel_width=pixel_width,
+        ).tolist(),
+    }
 
 
-@typechecked
-def add_recursive_edges(
-    *, G: nx.DiGraph, fig: go.Figure, plot_config: Plot_config, radius: float
-) -> None:
-    """Adds a circle, representing a recursive edge, above a node.
+@typechecked_debug
+def get_recursive_edge_shapes(
+    *, G: nx.DiGraph, plot_config: Plot_config, radius: float
+) -> List[Dict]:
+    """Returns the circles, representing a recursive edge, above each node.
 
     The circle line/edge colour is updated along with the node colour.
     """
-    for node_name in G.nodes:
-        x, y = G.nodes[node_name]["pos"]
+    shapes: List[Dict] = []
+    for _, node_attributes in G.nodes(data=True):
+        x, y = node_attributes["pos"]
         # Add circles
-        fig.add_shape(
-            type="circle",
-            xref="x",
-            yref="y",
-            x0=x - radius,
-            y0=y,
-            x1=x + radius,
-            y1=y + radius,
-            line_color=G.nodes[node_name]["colour"]
-            if plot_config.show_edge_colours
-            else None,
-            opacity=G.nodes[node_name]["opacity"]
-            if plot_config.show_edge_opacity
-            else None,
-            line=go.layout.shape.Line(width=plot_config.edge_width),
+        shapes.append(
+            {
+                "type": "circle",
+                "xref": "x",
+                "yref": "y",
+                "x0": x - radius,
+                "y0": y,
+                "x1": x + radius,
+                "y1": y + radius,
+                "line": {
+                    "color": node_attributes["colour"]
+                    if plot_config.show_edge_colours
+                    else None,
+                    "width": plot_config.edge_width,
+                },
+                "opacity": node_attributes["opacity"]
+                if plot_config.show_edge_opacity
+                else None,
+            }
         )
+    return shapes
 
 
 # pylint: disable = W0621
-@typechecked
+@typechecked_debug
 def get_regular_edge_arrows(
-    *, G: nx.DiGraph, plot_config: Plot_config
+    *,
+    G: nx.DiGraph,
+    left_xys: List[List[float]],
+    plot_config: Plot_config,
+    right_xys: List[List[float]],
 ) -> List[NamedAnnotation]:
     """Returns the annotation dictionaries representing the directed edge
-    arrows."""
+    arrows.
+
+    The left_xys and right_xys contain the edge coordinates in the order
+    of G.edges, as returned by get_static_layout.
+    """
     annotations: List[NamedAnnotation] = []
-    for edge in G.edges:
-        left_x, left_y, right_x, right_y = get_edge_xys(G=G, edge=edge)
+    for edge, (left_x, left_y), (right_x, right_y) in zip(
+        G.edges, left_xys, right_xys
+    ):
         if edge[0] != edge[1]:
             annotations.append(
                 NamedAnnotation(
@@ -238,34 +306,12 @@ def get_regular_edge_arrows(
 
 
 # pylint: disable = W0621
-@typechecked
-def get_edge_xys(
-    *, G: nx.DiGraph, edge: Tuple[str, str]
-) -> Tuple[float, float, float, float,]:
-    """Returns the left x and y values of an edge, followed by the right x y
-    values of an edge."""
-    # Get coordinates
-    left_node_name = edge[0]
-    right_node_name = edge[1]
-    left_x = G.nodes[left_node_name]["pos"][0]
-    left_y = G.nodes[left_node_name]["pos"][1]
-    right_x = G.nodes[right_node_name]["pos"][0]
-    right_y = G.nodes[right_node_name]["pos"][1]
-    return (
-        left_x,
-        left_y,
-        right_x,
-        right_y,
-    )
-
-
-# pylint: disable = W0621
-@typechecked
+@typechecked_debug
 def get_regular_and_recursive_edge_labels(
     *,
     G: nx.DiGraph,
-    pixel_height: int,
-    pixel_width: int,
+    angles: List[float],
+    mid_points: List[List[float]],
     plot_config: Plot_config,
     radius: float,
 ) -> List[NamedAnnotation]:
@@ -277,13 +323,14 @@ def get_regular_and_recursive_edge_labels(
     pos, because recursive edge circles are actually ovals.
 
     with height: 1 * radius, width:2 * radius, and you want to place the
-    recursive edge label in the center of the oval.
+    recursive edge label in the center of the oval. The angles and
+    mid_points are in the order of G.edges, as returned by
+    get_static_layout.
     """
     annotations = []
     if plot_config.show_edge_labels:
-        for edge in G.edges:
+        for edge, (mid_x, mid_y), angle in zip(G.edges, mid_points, angles):
             if edge[0] != edge[1]:  # For non recursive edges
-                mid_x, mid_y = get_edge_mid_point(G=G, edge=edge)
                 annotations.append(
                     NamedAnnotation(
                         category="non_recur_edge_label",
@@ -297,12 +344,7 @@ def get_regular_and_recursive_edge_labels(
                         align="center",
                         showarrow=False,
                         yanchor="bottom",
-                        textangle=get_stretched_edge_angle(
-                            G=G,
-                            edge=edge,
-                            pixel_height=pixel_height,
-                            pixel_width=pixel_width,
-                        ),
+                        textangle=angle,
                     )
                 )
             else:  # Recursive edge.
@@ -325,51 +367,47 @@ def get_regular_and_recursive_edge_labels(
     return annotations
 
 
-@typechecked
-def get_edge_mid_point(
-    edge: Tuple[str, str],
-    G: nx.DiGraph,
-) -> Tuple[float, float]:
-    """Returns the mid point of an edge."""
-    left_x, left_y, right_x, right_y = get_edge_xys(G=G, edge=edge)
-    mid_x = (right_x + left_x) / 2
-    mid_y = (right_y + left_y) / 2
-    return mid_x, mid_y
-
-
-@typechecked
-def get_stretched_edge_angle(
+@typechecked_debug
+def get_edge_coordinates(
     *,
-    edge: Tuple[str, str],
-    G: nx.DiGraph,
+    edges: Tuple[Tuple[str, str], ...],
+    node_names: Tuple[str, ...],
+    positions: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the left and right x,y-coordinates of all edges, in the order of
+    the edges, as two arrays with one row per edge.
+
+    The positions contain one x,y-row per node, in the order of the
+    node_names.
+    """
+    node_indices: Dict[str, int] = {
+        node_name: index for index, node_name in enumerate(node_names)
+    }
+    edge_indices: np.ndarray = np.asarray(
+        [(node_indices[left], node_indices[right]) for left, right in edges],
+        dtype=int,
+    ).reshape(-1, 2)
+    return positions[edge_indices[:, 0]], positions[edge_indices[:, 1]]
+
+
+@typechecked_debug
+def get_stretched_edge_angles(
+    *,
+    left_xys: np.ndarray,
+    right_xys: np.ndarray,
     pixel_height: int,
     pixel_width: int,
-) -> float:
-    """Returns the ccw+ angle of the edge (w.r.t.
+) -> np.ndarray:
+    """Returns the ccw+ angles of the edges (w.r.t.
 
     the horizontal), and adjusts for stretching of the image.
     """
-    left_x, left_y, right_x, right_y = get_edge_xys(G=G, edge=edge)
+    dxys: np.ndarray = right_xys - left_xys
 
     # Compute dx and change dx to accommodate the stretching of the image.
-    dx = (right_x - left_x) * (
-        1 - ((pixel_height - pixel_width) / pixel_height)
-    )
-    dy = right_y - left_y
-    angle = np.arctan2(dy, dx)
-    return float(-np.rad2deg(angle))
-
-
-def get_pure_edge_angle(
-    G: nx.DiGraph, edge: Tuple[str, str]
-) -> Tuple[int, int]:
-    """Returns the ccw+ mid point of an edge."""
-    left_x, left_y, right_x, right_y = get_edge_xys(G=G, edge=edge)
-    dx = right_x - left_x
-    dy = right_y - left_y
-    angle = np.arctan2(dy, dx)
-    # return -np.rad2deg((angle) % (2 * np.pi))
-    return -np.rad2deg(angle)
+    dxs = dxys[:, 0] * (1 - ((pixel_height - pixel_width) / pixel_height))
+    angles = np.arctan2(dxys[:, 1], dxs)
+    return -np.rad2deg(angles)
 
 
 @typechecked
@@ -406,7 +444,7 @@ def add_ticks_to_snn_graph(
         mdsa_snn.graph["y_ticks"] = y_ticks
 
 
-@typechecked
+@typechecked_debug
 def split_until_no_letters(*, node_name: str) -> str:
     """Split the input string on underscores and return the left-hand segments
     (excluding the underscore) until they don't contain any letters anymore.
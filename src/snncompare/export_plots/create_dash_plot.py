@@ -1,6 +1,6 @@
 """Generates interactive view of graph."""
-from pathlib import Path
-from typing import Dict, List, Optional, Union
+import logging
+from typing import Dict, List, Optional, Set, Union
 
 import dash
 import networkx as nx
@@ -26,9 +26,12 @@ from snncompare.export_plots.store_plot_data_in_graph import (
     store_plot_params_in_graph,
 )
 from snncompare.helper import get_some_duration
+from snncompare.import_results.helper import get_filenames_in_dir
 from snncompare.optional_config.Output_config import Output_config
 from snncompare.run_config.Run_config import Run_config
 
+logger = logging.getLogger(__name__)
+
 
 # Determine which graph(s) the user would like to see.
 # If no specific preference specified, show all 4.
@@ -45,7 +48,6 @@ def create_svg_plot(
     single_timestep: Optional[int] = None,
 ) -> None:
     """Creates the svg plots."""
-    print("INSIDE")
     plot_config: Plot_config = get_default_plot_config()
 
     app = dash.Dash(__name__)
@@ -56,16 +58,13 @@ def create_svg_plot(
 
     for _, (graph_name, snn_graph) in enumerate(graphs.items()):
         if graph_name in graph_names:
-            print("")
-            print("")
-
             sim_duration = get_some_duration(
                 simulator=run_config.simulator,
                 snn_graph=snn_graph,
                 duration_name="actual_duration",
             )
 
-            print(f"Creating:graph_name={graph_name}")
+            logger.debug("Creating:graph_name=%s", graph_name)
 
             # Convert simsnn to nx_LIF
             if (
@@ -123,17 +122,25 @@ def create_figures(
     """Creates the dash figures."""
     dash_screens: List[go.Figure] = []
     plotted_graph: nx.DiGraph = nx.DiGraph()
+
+    # List the existing images once, instead of checking each image file.
+    image_dir: str = "latex/Images/graphs"
+    create_root_dir_if_not_exists(root_dir_name=image_dir)
+    existing_image_filenames: Set[str] = set(
+        get_filenames_in_dir(dirpath=image_dir)
+    )
     for t in range(
         0,
         sim_duration,
         # 1,
     ):
-        print(f"t={t}/{sim_duration}")
+        logger.debug("t=%s/%s", t, sim_duration)
 
         # Create and store the svg images per timestep.
         filename: str = f"{graph_name}_{run_config_filename}_{t}"
-        svg_filepath: str = f"latex/Images/graphs/{filename}.svg"
-        if not Path(svg_filepath).is_file() or (
+        svg_filepath: str = f"{image_dir}/{filename}.svg"
+        svg_exists: bool = f"{filename}.svg" in existing_image_filenames
+        if not svg_exists or (
             output_config.extra_storing_config.show_images
             and single_timestep is None
         ):
@@ -145,9 +152,8 @@ def create_figures(
                 t=t,
             )
             dash_screens.append(dash_figure)
-        if not Path(svg_filepath).is_file():
+        if not svg_exists:
             # TODO move storing into separate function.
-            create_root_dir_if_not_exists(root_dir_name="latex/Images/graphs")
             dash_figure.write_image(svg_filepath)
     dash_figures[graph_name] = dash_screens
     plotted_graphs[graph_name] = plotted_graph
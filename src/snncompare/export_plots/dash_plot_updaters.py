@@ -11,6 +11,7 @@ from typeguard import typechecked
 
 from snncompare.export_plots.create_dash_fig_obj import NamedAnnotation
 from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.optional_decorators import typechecked_debug
 
 
 @typechecked
@@ -43,7 +44,7 @@ def update_node_colour_and_opacity(
 
 
 # pylint: disable=R0801
-@typechecked
+@typechecked_debug
 def update_non_recursive_edge_colour(
     *,
     dash_figure: go.Figure,
@@ -84,7 +85,7 @@ def update_non_recursive_edge_colour(
                 dash_figure.layout.annotations[i].opacity = edge_opacity
 
 
-@typechecked
+@typechecked_debug
 def get_edge_colour(
     *,
     edge: Tuple[str, str],
@@ -244,7 +245,7 @@ def support_updates(
     initial_t = 0
 
     graph_name_one = "snn_algo_graph"
-    if graph_name_one in plotted_graphs.keys():
+    if graph_name_one in plotted_graphs:
 
         @app.callback(
             Output(f"Graph{graph_name_one}", "figure"),
@@ -297,7 +298,7 @@ def support_updates(
         )
 
     graph_name_two = "adapted_snn_graph"
-    if graph_name_two in plotted_graphs.keys():
+    if graph_name_two in plotted_graphs:
 
         @app.callback(
             Output(f"Graph{graph_name_two}", "figure"),
@@ -351,7 +352,7 @@ def support_updates(
 
     # Manual copy
     graph_name_four = "rad_adapted_snn_graph"
-    if graph_name_four in plotted_graphs.keys():
+    if graph_name_four in plotted_graphs:
 
         @app.callback(
             Output(f"Graph{graph_name_four}", "figure"),
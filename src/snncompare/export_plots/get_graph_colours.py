@@ -1,9 +1,14 @@
 """Returns the updated plot data."""
+import logging
 from typing import Dict
 
 import networkx as nx
 from typeguard import typechecked
 
+from snncompare.optional_decorators import typechecked_debug
+
+logger = logging.getLogger(__name__)
+
 
 @typechecked
 def get_nx_node_colours(*, G: nx.DiGraph, t: int) -> Dict[str, str]:
@@ -16,18 +21,18 @@ def get_nx_node_colours(*, G: nx.DiGraph, t: int) -> Dict[str, str]:
         "gray": "rgb(128, 128, 128)",
     }
     colour_dict: Dict[str, str] = {}
-    for node_name in G.nodes:
-        if "nx_lif" in G.nodes[node_name].keys():
+    for node_name, node_attributes in G.nodes(data=True):
+        if "nx_lif" in node_attributes:
             set_radiation_death_colour(
                 colour_dict=colour_dict,
-                G=G,
+                node_attributes=node_attributes,
                 node_name=node_name,
                 rgb_colours=rgb_colours,
                 t=t,
             )
             set_spiking_neuron_colour(
                 colour_dict=colour_dict,
-                G=G,
+                node_attributes=node_attributes,
                 node_name=node_name,
                 rgb_colours=rgb_colours,
                 t=t,
@@ -43,40 +48,39 @@ def get_nx_node_colours(*, G: nx.DiGraph, t: int) -> Dict[str, str]:
     return colour_dict
 
 
-@typechecked
+@typechecked_debug
 def set_radiation_death_colour(
     *,
     colour_dict: Dict,
-    G: nx.DiGraph,
+    node_attributes: Dict,
     node_name: str,
     rgb_colours: Dict[str, str],
     t: int,
 ) -> None:
     """Adds the radiation death colour into the colour dict for the nodes."""
-    if "rad_death" in G.nodes[node_name].keys():
-        if G.nodes[node_name]["rad_death"]:
-            colour_dict[node_name] = rgb_colours["red"]
-            if G.nodes[node_name]["nx_lif"][t].spikes:
-                print(f"DEAD NEURON:{node_name} spiked at {t}.")
-                # TODO: restore error
-                # raise ValueError("Dead neuron can't spike.")
+    if node_attributes.get("rad_death", False):
+        colour_dict[node_name] = rgb_colours["red"]
+        if node_attributes["nx_lif"][t].spikes:
+            logger.warning("DEAD NEURON:%s spiked at %s.", node_name, t)
+            # TODO: restore error
+            # raise ValueError("Dead neuron can't spike.")
 
 
-@typechecked
+@typechecked_debug
 def set_spiking_neuron_colour(
     *,
     colour_dict: Dict,
-    G: nx.DiGraph,
+    node_attributes: Dict,
     node_name: str,
     rgb_colours: Dict[str, str],
     t: int,
 ) -> None:
     """Adds the spiking colour into the colour dict for the nodes."""
-    if G.nodes[node_name]["nx_lif"][t].spikes:
+    if node_attributes["nx_lif"][t].spikes:
         colour_dict[node_name] = rgb_colours["green"]
 
 
-@typechecked
+@typechecked_debug
 def set_remaining_node_colours(
     *,
     colour_dict: Dict,
@@ -90,7 +94,7 @@ def set_remaining_node_colours(
     colour/dark yellow.
     """
     if node_name not in colour_dict:
-        if node_name[:2] == "r_":
+        if node_name.startswith("r_"):
             colour_dict[node_name] = rgb_colours["olive"]
         else:
             colour_dict[node_name] = rgb_colours["yellow"]
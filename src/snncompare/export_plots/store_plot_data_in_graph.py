@@ -7,6 +7,7 @@ from typeguard import typechecked
 
 from snncompare.export_plots.get_graph_colours import get_nx_node_colours
 from snncompare.optional_config.Output_config import Hover_info
+from snncompare.optional_decorators import typechecked_debug
 
 
 @typechecked
@@ -18,11 +19,7 @@ def get_neurons_in_graph(
 
     TODO: support different neuron types.
     """
-    neurons: List[LIF_neuron] = []
-    for node_name in snn_graph.nodes():
-        nx_lifs: Dict[str, List[LIF_neuron]] = snn_graph.nodes[node_name]
-        neurons.append(nx_lifs["nx_lif"][t])
-    return neurons
+    return [nx_lifs[t] for _, nx_lifs in snn_graph.nodes(data="nx_lif")]
 
 
 # pylint: disable=R0912
@@ -92,26 +89,22 @@ def store_node_labels(
     """Stores the node labels into the plotted graph."""
 
     # TODO: move into separate function.
-    used_node_names: List[str] = []
+    # The hovertext dict keeps the node order, and its keys are used for the
+    # duplicate check, which is O(1) per node instead of O(n) for a list.
+    hovertext: Dict[str, str] = {}
     for neuron in lif_neurons:
         if "connector" not in neuron.full_name:
             # Assert no duplicate node_names exist.
-            if neuron.full_name in used_node_names:
+            if neuron.full_name in hovertext:
                 raise ValueError(
                     f"Error, duplicate node_names:{neuron.full_name} not "
                     + " supported."
                 )
-            used_node_names.append(neuron.full_name)
+            hovertext[neuron.full_name] = ""
 
-    hovertext: Dict[str, str] = {
-        node_name: "" for node_name in used_node_names
-    }
-    for node_name in used_node_names:
+    for node_name in hovertext:
         # Initialise the list of node hovertexts, per node.
-        if (
-            "temporal_node_hovertext"
-            not in plotted_graph.nodes[node_name].keys()
-        ):
+        if "temporal_node_hovertext" not in plotted_graph.nodes[node_name]:
             plotted_graph.nodes[node_name]["temporal_node_hovertext"] = []
 
         # Add node hovertext data per node
@@ -152,9 +145,9 @@ def store_node_colours_and_opacity(
     for node_name, colour in colour_dict.items():
         if "connector" not in node_name:
             # Store colours over time.
-            if "temporal_colour" not in plotted_graph.nodes[node_name].keys():
+            if "temporal_colour" not in plotted_graph.nodes[node_name]:
                 plotted_graph.nodes[node_name]["temporal_colour"] = []
-            if "temporal_opacity" not in plotted_graph.nodes[node_name].keys():
+            if "temporal_opacity" not in plotted_graph.nodes[node_name]:
                 plotted_graph.nodes[node_name]["temporal_opacity"] = []
 
             plotted_graph.nodes[node_name]["colour"] = colour
@@ -186,7 +179,7 @@ def store_edge_colour_and_opacity(
             ]["opacity"]
 
 
-@typechecked
+@typechecked_debug
 def get_desired_neuron_properties(
     snn_graph: nx.DiGraph,
     neuron_properties: List[str],
@@ -213,7 +206,7 @@ def get_desired_neuron_properties(
     return "".join(properties)
 
 
-@typechecked
+@typechecked_debug
 def get_edges_of_node(
     snn_graph: nx.DiGraph,
     node_name: str,
@@ -2,10 +2,11 @@
 the performance of the SNNs."""
 
 import copy
+import logging
 
 # Take in exp_config or run_configs
 # If exp_config, get run_configs
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
 import matplotlib.pyplot as plt
 import networkx as nx
@@ -23,6 +24,9 @@ from snncompare.graph_generation.stage_1_create_graphs import (
     load_input_graph_from_file_with_init_props,
 )
 from snncompare.helper import get_snn_graph_names
+from snncompare.import_results.load_stage1_results import (
+    get_outputted_run_config_unique_ids,
+)
 from snncompare.import_results.load_stage4 import load_stage4_results
 from snncompare.import_results.load_stage_1_and_2 import (
     has_outputted_stage_1,
@@ -33,6 +37,8 @@ from snncompare.progress_report.has_completed_stage2_or_4 import (
 )
 from snncompare.run_config.Run_config import Run_config
 
+logger = logging.getLogger(__name__)
+
 
 # pylint: disable = R0903
 class Boxplot_x_val:
@@ -161,6 +167,31 @@ def get_image_name(*, count: int, rad_setts: Rad_damage) -> str:
     )
 
 
+@typechecked
+def has_completed_stage_4(
+    *,
+    run_config: Run_config,
+) -> bool:
+    """Returns True if the stage 1 and stage 4 outputs of the run config
+    exist."""
+    input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
+        run_config=run_config
+    )
+    if not has_outputted_stage_1(
+        input_graph=input_graph,
+        run_config=run_config,
+    ):
+        return False
+    graphs_dict: Dict = load_stage1_simsnn_graphs(
+        run_config=run_config,
+    )
+    return has_outputted_stage_2_or_4(
+        graphs_dict=graphs_dict,
+        run_config=run_config,
+        stage_index=4,
+    )
+
+
 @typechecked
 def get_completed_and_missing_run_configs(
     *,
@@ -170,25 +201,14 @@ def get_completed_and_missing_run_configs(
     missing_run_configs: List[Run_config] = []
     completed_run_configs: List[Run_config] = []
 
+    # List the outputted run configs once, such that run configs without
+    # output are skipped without loading their graphs.
+    outputted_run_config_ids: Set[str] = get_outputted_run_config_unique_ids()
     for run_config in run_configs:
-        input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
-            run_config=run_config
-        )
-        if has_outputted_stage_1(
-            input_graph=input_graph,
-            run_config=run_config,
+        if run_config.unique_id in outputted_run_config_ids and (
+            has_completed_stage_4(run_config=run_config)
         ):
-            graphs_dict: Dict = load_stage1_simsnn_graphs(
-                run_config=run_config,
-            )
-            if has_outputted_stage_2_or_4(
-                graphs_dict=graphs_dict,
-                run_config=run_config,
-                stage_index=4,
-            ):
-                completed_run_configs.append(run_config)
-            else:
-                missing_run_configs.append(run_config)
+            completed_run_configs.append(run_config)
         else:
             missing_run_configs.append(run_config)
     if len(missing_run_configs) > 0:
@@ -245,8 +265,7 @@ def get_boxplot_datapoints(
                 # boxplot_data.
                 for x_label in x_labels:
                     # TODO: verify this check is correct.
-                    # pylint: disable=C0201
-                    if x_label in results.keys():
+                    if x_label in results:
                         add_graph_scores(
                             boxplot_data=boxplot_data,
                             x_label=x_label,
@@ -387,14 +406,13 @@ def boxplot_data_to_y_series(
 
     for name, seed_and_y_vals in boxplot_data.items():
         for seed, y_score in seed_and_y_vals.items():
-            print(f"{name},  seed={seed},  {y_score.__dict__}")
+            logger.debug("%s, seed=%s, %s", name, seed, y_score.__dict__)
             columns[name].append(
                 # Compute the score in range [0,1] and add it to the column
                 # score list.
                 float(y_score.correct_results)
                 / float(y_score.correct_results + y_score.wrong_results)
             )
-    print("")
     return columns
 
 
@@ -193,7 +193,7 @@ def get_experiment_configurations_for_adaptation_settings(
 
     # Per algorithm setting (e.g. MDSA value:)
     # pylint: disable=R1702
-    if "MDSA" in exp_config.algorithms.keys():
+    if "MDSA" in exp_config.algorithms:
         algorithm_name: str = "MDSA"
         for m_val_dict in exp_config.algorithms[algorithm_name]:
             m_val: int = m_val_dict["m_val"]
@@ -1,12 +1,31 @@
 """Exports the test results to a json file."""
 import json
+import os
+from contextlib import nullcontext
+from multiprocessing.synchronize import Lock
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import networkx as nx
 from networkx.readwrite import json_graph
 from typeguard import typechecked
 
+from snncompare.import_results.helper import file_contains_line
+
+# Serialises the check-then-append of the seed hash files, which are shared
+# by the runs of an experiment. It is only set in the worker processes that
+# perform runs in parallel, see set_shared_file_lock.
+SHARED_FILE_LOCK: Optional[Lock] = None
+
+
+@typechecked
+def set_shared_file_lock(*, lock: Lock) -> None:
+    """Sets the lock that the worker processes of an experiment share when
+    they append to files that are shared by multiple runs."""
+    # pylint: disable=W0603
+    global SHARED_FILE_LOCK
+    SHARED_FILE_LOCK = lock
+
 
 @typechecked
 def write_to_json(
@@ -14,15 +33,20 @@ def write_to_json(
 ) -> None:
     """Writes a dict file to a .json file.
 
+    The dict is first written to a temporary file which then replaces
+    the output file, such that a run in another worker process never
+    reads a partially written file.
+
     TODO: Rename some_dict to some_text.
     """
-
-    with open(output_filepath, "w", encoding="utf-8") as fp:
-        if isinstance(some_dict, Dict):
+    temporary_filepath: str = f"{output_filepath}.{os.getpid()}.tmp"
+    with open(temporary_filepath, "w", encoding="utf-8") as fp:
+        if isinstance(some_dict, dict):
             json.dump(some_dict, fp, indent=4, sort_keys=True)
-        elif isinstance(some_dict, List):
+        elif isinstance(some_dict, list):
             json.dump(some_dict, fp, indent=4, sort_keys=True)
         fp.close()
+    os.replace(temporary_filepath, output_filepath)
 
     # Verify the file exists.
     if not Path(output_filepath).is_file():
@@ -31,12 +55,27 @@ def write_to_json(
         )
 
 
+@typechecked
+def append_line_if_missing(*, filepath: str, line: str) -> None:
+    """Appends a line to a text file, unless the file already contains it.
+
+    The check and the append are done while holding the shared file
+    lock, such that parallel runs do not append the same line twice.
+    """
+    with SHARED_FILE_LOCK or nullcontext():
+        if not os.path.isfile(filepath) or not file_contains_line(
+            filepath=filepath, expected_line=line
+        ):
+            with open(filepath, "a", encoding="utf-8") as txt_file:
+                txt_file.write(f"{line}\n")
+
+
 def verify_loaded_json_content_is_nx_graph(
     output_filepath: str, some_dict: Dict
 ) -> None:
     """Verifies an exported graph can be loaded correctly."""
     # TODO: verify the file content is valid.
-    if "graph" in some_dict.keys():
+    if "graph" in some_dict:
         with open(output_filepath, encoding="utf-8") as json_file:
             graph_dict = json.load(json_file)
             json_file.close()
@@ -62,7 +101,7 @@ def encode_tuples(*, some_dict: Dict, decode: bool = False) -> Dict:
     for key, val in some_dict.items():
         if isinstance(val, tuple):
             val = enc.encode(val)
-        elif isinstance(val, List):
+        elif isinstance(val, list):
             if key == "size_and_max_graphs":
                 if decode:
                     some_dict[key] = list(
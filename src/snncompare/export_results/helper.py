@@ -3,7 +3,7 @@ import collections
 import copy
 import hashlib
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
@@ -103,28 +103,32 @@ def get_expected_image_paths_stage_3(  # type:ignore[misc]
 
     (If export is on).
     """
-    image_filepaths = []
-
-    if "alg_props" not in input_graph.graph.keys():
+    if "alg_props" not in input_graph.graph:
         raise KeyError("Error, algo_props is not set.")
 
     # TODO: move this into hardcoded setting.
     image_dir = "latex/Images/graphs/"
-    for extension in extensions:
-        for graph_name, snn_graph in nx_graphs_dict.items():
-            if graph_name != "input_graph":
-                sim_duration = get_some_duration(
-                    simulator=run_config.simulator,
-                    snn_graph=snn_graph,
-                    duration_name="actual_duration",
-                )
-                for t in range(0, sim_duration):
-                    image_filepaths.append(
-                        image_dir
-                        + f"{graph_name}_{run_config.unique_id}"
-                        + f"_{t}.{extension}"
-                    )
-    return image_filepaths
+
+    # The filename prefix and duration of a graph do not depend on the
+    # extension, so compute them once per graph.
+    prefixes_and_durations: List[Tuple[str, int]] = [
+        (
+            f"{image_dir}{graph_name}_{run_config.unique_id}_",
+            get_some_duration(
+                simulator=run_config.simulator,
+                snn_graph=snn_graph,
+                duration_name="actual_duration",
+            ),
+        )
+        for graph_name, snn_graph in nx_graphs_dict.items()
+        if graph_name != "input_graph"
+    ]
+    return [
+        f"{prefix}{t}.{extension}"
+        for extension in extensions
+        for prefix, sim_duration in prefixes_and_durations
+        for t in range(0, sim_duration)
+    ]
 
 
 @typechecked
@@ -138,7 +142,7 @@ def get_unique_run_config_id(  # type:ignore[misc]
     If it does contains the identifier, throws an error. Otherwise
     computes the unique identifier hash and appends it.
     """
-    if "unique_id" in run_config.__dict__.keys():
+    if "unique_id" in run_config.__dict__:
         raise KeyError(
             f"Error, the exp_config:{run_config}\n"
             + "already contains a unique identifier."
@@ -24,6 +24,7 @@ from typeguard import typechecked
 # if TYPE_CHECKING:
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.export_results.export_json_results import (
+    append_line_if_missing,
     verify_loaded_json_content_is_nx_graph,
     write_to_json,
 )
@@ -256,15 +257,10 @@ def output_mdsa_rand_nrs(
         stage_index=stage_index,
     )
 
-    if not rand_nrs_data.seed_hash_file_exists or not file_contains_line(
+    append_line_if_missing(
         filepath=rand_nrs_data.seed_hash_filepath,
-        expected_line=rand_nrs_data.rand_nrs_hash,
-    ):
-        with open(
-            rand_nrs_data.seed_hash_filepath, "a", encoding="utf-8"
-        ) as txt_file:
-            txt_file.write(f"{rand_nrs_data.rand_nrs_hash}\n")
-            txt_file.close()
+        line=rand_nrs_data.rand_nrs_hash,
+    )
 
     if not rand_nrs_data.rand_nrs_file_exists:
         output_unique_list_int_or_dict(
@@ -405,12 +401,7 @@ def output_radiation_data(
 
     # Also append the affected_neuron_hash to the list of radiation settings
     # per seed.
-    if not radiation_data.seed_hash_file_exists or not file_contains_line(
+    append_line_if_missing(
         filepath=radiation_data.seed_hash_filepath,
-        expected_line=radiation_data.rad_affected_neurons_hash,
-    ):
-        with open(
-            radiation_data.seed_hash_filepath, "a", encoding="utf-8"
-        ) as txt_file:
-            txt_file.write(f"{radiation_data.rad_affected_neurons_hash}\n")
-            txt_file.close()
+        line=radiation_data.rad_affected_neurons_hash,
+    )
@@ -6,14 +6,13 @@
     rad_snn_algo_graph: spikes, du, dv.
     rad_adapted_snn_algo_graph: spikes, du, dv.
 """
-import json
-from pathlib import Path
 from typing import Dict, List, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
+from snncompare.export_results.export_json_results import write_to_json
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
 )
@@ -124,19 +123,6 @@ def output_snn_graph_stage_2(
         i: List = snn_graph.multimeter.I.tolist()
         spikes: List = snn_graph.raster.spikes.tolist()
         neuron_dict: Dict = {"V": v, "I": i, "spikes": spikes}
-        with open(output_filepath, "w", encoding="utf-8") as fp:
-            json.dump(
-                neuron_dict,
-                fp,
-                indent=4,
-                sort_keys=True,
-            )
-            fp.close()
-
-        # Verify the file exists.
-        if not Path(output_filepath).is_file():
-            raise FileExistsError(
-                f"Error, filepath:{output_filepath} was not created."
-            )
+        write_to_json(output_filepath=output_filepath, some_dict=neuron_dict)
     else:
         raise NotImplementedError(f"Error, {type(snn_graph)} not supported.")
@@ -6,14 +6,13 @@
     rad_snn_algo_graph: spikes, du, dv.
     rad_adapted_snn_algo_graph: spikes, du, dv.
 """
-import json
-from pathlib import Path
 from typing import Dict, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
+from snncompare.export_results.export_json_results import write_to_json
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     Radiation_data,
     get_rad_name_filepath_and_exists,
@@ -118,20 +117,7 @@ def output_some_graph_property_dict(
             f"Error, simulator:{simulator} not implemented."
         )
 
-    with open(output_filepath, "w", encoding="utf-8") as fp:
-        json.dump(
-            dict_content,
-            fp,
-            indent=4,
-            sort_keys=True,
-        )
-        fp.close()
-
-    # Verify the file exists.
-    if not Path(output_filepath).is_file():
-        raise FileExistsError(
-            f"Error, filepath:{output_filepath} was not created."
-        )
+    write_to_json(output_filepath=output_filepath, some_dict=dict_content)
 
     # loaded_results: Dict = load_json_file_into_dict(
     #     json_filepath=output_filepath
@@ -53,9 +53,9 @@ def verify_json_graphs_dict_contain_correct_stages(
                         "Error, the json_graph is of type:"
                         f"{type(json_graph)}, with content:{json_graph}"
                     )
-                if "graph" not in json_graph.keys():
+                if "graph" not in json_graph:
                     raise SystemError("Error, graph not in json graphs keys.")
-                if "completed_stages" not in json_graph["graph"].keys():
+                if "completed_stages" not in json_graph["graph"]:
                     raise SystemError(
                         "Error, completed_stages not in json graphs graph"
                         + " keys."
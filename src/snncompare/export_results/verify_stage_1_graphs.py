@@ -10,11 +10,13 @@ Input: Experiment configuration.
         mechanism.
 """
 # pylint: disable=W0613
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.optional_decorators import typechecked_debug
 from snncompare.run_config.Run_config import Run_config
 
 from ..graph_generation.stage_1_create_graphs import has_adaptation
@@ -42,25 +44,45 @@ def verify_stage_1_graphs(
     # TODO: verify the properties required by the run config are in the graphs.
 
 
-@typechecked
+@typechecked_debug
 def get_expected_stage_1_graph_names(
     *,
     run_config: Run_config,
 ) -> List[str]:
     """Parses the run config and returns a list with the graph names that are
     expected at the end of stage 1."""
+    return list(
+        get_expected_stage_1_graph_names_of_settings(
+            simulator=run_config.simulator,
+            with_adaptation=has_adaptation(run_config=run_config),
+            with_radiation=bool(run_config.radiation),
+        )
+    )
 
-    # TODO: make into hash
+
+@lru_cache(maxsize=None)
+def get_expected_stage_1_graph_names_of_settings(
+    *,
+    simulator: str,
+    with_adaptation: bool,
+    with_radiation: bool,
+) -> Tuple[str, ...]:
+    """Returns the graph names that are expected at the end of stage 1 for
+    the run config settings that determine them.
+
+    There are only a few combinations of these settings, so the names
+    are cached per combination instead of derived for every check.
+    """
     expected_graph_names = ["input_graph", "snn_algo_graph"]
-    if has_adaptation(run_config=run_config):
+    if with_adaptation:
         expected_graph_names.append("adapted_snn_graph")
 
-    if not run_config.simulator == "simsnn":
-        if run_config.radiation:
+    if not simulator == "simsnn":
+        if with_radiation:
             expected_graph_names.append("rad_snn_algo_graph")
-            if has_adaptation(run_config=run_config):
+            if with_adaptation:
                 expected_graph_names.append("rad_adapted_snn_graph")
-    return expected_graph_names
+    return tuple(expected_graph_names)
 
 
 @typechecked
@@ -1,7 +1,9 @@
 """Helps with exporting input graphs."""
+import copy
 import json
 import os
 import pickle  # nosec
+from functools import lru_cache
 from pathlib import Path
 from pprint import pprint
 from typing import Dict, List
@@ -11,8 +13,10 @@ from networkx.readwrite import json_graph
 from typeguard import typechecked
 
 # if TYPE_CHECKING:
+from snncompare.export_results.export_json_results import write_to_json
 from snncompare.import_results.helper import (
     create_relative_path,
+    get_filenames_in_dir,
     get_isomorphic_graph_hash,
 )
 from snncompare.run_config.Run_config import Run_config
@@ -27,14 +31,34 @@ def load_input_graph_based_on_nr(graph_size: int, graph_nr: int) -> nx.Graph:
     """
 
     output_dir: str = f"results/stage1/input_graphs/{graph_size}/"
-    input_graph_hashes: List[str] = [
-        name
-        for name in os.listdir(output_dir)
-        if os.path.isfile(os.path.join(output_dir, name))
-    ]
+    input_graph_hashes: List[str] = get_filenames_in_dir(dirpath=output_dir)
     output_filepath: str = f"{output_dir}{input_graph_hashes[graph_nr]}"
 
-    # Load graph from file and verify it results in the same graph.
+    # Return a deep copy, because the callers add properties to the input
+    # graph, and may modify the attribute values of its nodes and edges.
+    file_stat: os.stat_result = os.stat(output_filepath)
+    return copy.deepcopy(
+        load_input_graph_from_json_file(
+            output_filepath=output_filepath,
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+        )
+    )
+
+
+# pylint: disable=W0613
+@lru_cache(maxsize=64)
+def load_input_graph_from_json_file(
+    *, output_filepath: str, mtime_ns: int, size: int
+) -> nx.Graph:
+    """Loads an input graph from its json file and converts it into an nx
+    object, cached per filepath, modification time and file size.
+
+    The same input graph is loaded multiple times per run configuration.
+    The modification time and size are only used in the cache key, such
+    that an input graph that is outputted again is loaded again. Do not
+    modify the returned graph, modify a deep copy instead.
+    """
     with open(output_filepath, encoding="utf-8") as json_file:
         some_json_graph = json.load(json_file)
         json_file.close()
@@ -50,13 +74,7 @@ def has_outputted_input_graph_for_graph_size_and_nr(
     output_dir: str = f"results/stage1/input_graphs/{graph_size}/"
     if not os.path.isdir(output_dir):
         return False
-    nr_of_input_graphs: int = len(
-        [
-            name
-            for name in os.listdir(output_dir)
-            if os.path.isfile(os.path.join(output_dir, name))
-        ]
-    )
+    nr_of_input_graphs: int = len(get_filenames_in_dir(dirpath=output_dir))
 
     return nr_of_input_graphs > graph_nr
 
@@ -102,17 +120,8 @@ def write_undirected_graph_to_json(
 ) -> None:
     """Writes an undirected graph to json and verifies it can be loaded back
     into the graph."""
-    with open(output_filepath, "w", encoding="utf-8") as fp:
-        # json.dump(the_graph.__dict__, fp, indent=4, sort_keys=True)
-        some_json_graph: Dict = json_graph.node_link_data(the_graph)
-        json.dump(some_json_graph, fp, indent=4, sort_keys=True)
-        fp.close()
-
-    # Verify the file exists.
-    if not Path(output_filepath).is_file():
-        raise FileExistsError(
-            f"Error, filepath:{output_filepath} was not created."
-        )
+    some_json_graph: Dict = json_graph.node_link_data(the_graph)
+    write_to_json(output_filepath=output_filepath, some_dict=some_json_graph)
 
     # Load graph from file and verify it results in the same graph.
     with open(output_filepath, encoding="utf-8") as json_file:
@@ -79,7 +79,7 @@ def nx_lif_graphs_to_simsnn_graphs(
     """Converts nx_lif graphs to sim snn graphs."""
     new_graphs: Dict = {}
     new_graphs["input_graph"] = stage_1_graphs["input_graph"]
-    if "alg_props" not in new_graphs["input_graph"].graph.keys():
+    if "alg_props" not in new_graphs["input_graph"].graph:
         new_graphs["input_graph"].graph[
             "alg_props"
         ] = SNN_initialisation_properties(
@@ -119,8 +119,8 @@ def nx_lif_graph_to_simsnn_graph(
     sim = Simulator(net, monitor_I=True)
 
     simsnn: Dict[str, LIF] = {}
-    for node_name in snn_graph.nodes:
-        nx_lif: LIF_neuron = snn_graph.nodes[node_name]["nx_lif"][0]
+    for node_name, node_attributes in snn_graph.nodes(data=True):
+        nx_lif: LIF_neuron = node_attributes["nx_lif"][0]
         if nx_lif.dv.get() > 1 or nx_lif.dv.get() < -1:
             raise ValueError(
                 f"Error, dv={nx_lif.dv.get()} is not in range [-1,1] for: "
@@ -144,13 +144,13 @@ def nx_lif_graph_to_simsnn_graph(
             pos=nx_lif.pos,
             spike_only_if_thr_exceeded=True,
         )
-    for edge in snn_graph.edges():
-        synapse = snn_graph.edges[edge]["synapse"]
+    for left, right, edge_attributes in snn_graph.edges(data=True):
+        synapse = edge_attributes["synapse"]
         # pylint: disable=R0801
         net.createSynapse(
-            pre=simsnn[edge[0]],
-            post=simsnn[edge[1]],
-            ID=edge,
+            pre=simsnn[left],
+            post=simsnn[right],
+            ID=(left, right),
             w=synapse.weight,
             d=1,
         )
@@ -248,14 +248,14 @@ def get_adapted_graph(
             adaptation=run_config.adaptation
         )
         adaptation_graph: nx.DiGraph = apply_sparse_redundancy(
-            adaptation_graph=copy.deepcopy(snn_algo_graph),
+            adaptation_graph=clone_snn_graph(snn_graph=snn_algo_graph),
             plot_config=plot_config,
             redundancy=run_config.adaptation.redundancy,
         )
 
     elif run_config.adaptation.adaptation_type == "population":
         adaptation_graph = apply_population_coding(
-            adaptation_graph=copy.deepcopy(snn_algo_graph),
+            adaptation_graph=clone_snn_graph(snn_graph=snn_algo_graph),
             plot_config=plot_config,
             redundancy=run_config.adaptation.redundancy,
         )
@@ -289,7 +289,7 @@ def get_redundant_graph(
     *, snn_algo_graph: nx.DiGraph, plot_config: Plot_config, red_lev: int
 ) -> nx.DiGraph:
     """Returns a networkx graph that has a form of adaptation added."""
-    adaptation_graph = copy.deepcopy(snn_algo_graph)
+    adaptation_graph = clone_snn_graph(snn_graph=snn_algo_graph)
     apply_sparse_redundancy(
         adaptation_graph=adaptation_graph,
         plot_config=plot_config,
@@ -298,6 +298,49 @@ def get_redundant_graph(
     return adaptation_graph
 
 
+@typechecked
+def clone_snn_graph(*, snn_graph: nx.DiGraph) -> nx.DiGraph:
+    """Returns a copy of an snn graph that can be adapted without modifying
+    the original snn graph.
+
+    Instead of passing the whole graph through copy.deepcopy, the
+    networkx structure is rebuilt from the node and edge attribute
+    dicts, and only the mutable attribute values (like the nx_lif
+    neurons and synapses) are deep-copied. Immutable values are shared.
+    """
+    memo: Dict[int, object] = {}
+    clone: nx.DiGraph = snn_graph.__class__()
+    clone.graph.update(
+        clone_attribute_dict(attributes=snn_graph.graph, memo=memo)
+    )
+    clone.add_nodes_from(
+        (node_name, clone_attribute_dict(attributes=attributes, memo=memo))
+        for node_name, attributes in snn_graph.nodes(data=True)
+    )
+    clone.add_edges_from(
+        (left, right, clone_attribute_dict(attributes=attributes, memo=memo))
+        for left, right, attributes in snn_graph.edges(data=True)
+    )
+    return clone
+
+
+@typechecked
+def clone_attribute_dict(*, attributes: Dict, memo: Dict[int, object]) -> Dict:
+    """Returns a copy of a node/edge/graph attribute dict in which only the
+    mutable values are deep-copied.
+
+    The memo is shared between all attribute dicts of a graph, such that
+    objects that are referenced from multiple places remain shared in
+    the copy.
+    """
+    return {
+        key: value
+        if isinstance(value, (bool, float, int, str, type(None)))
+        else copy.deepcopy(value, memo)
+        for key, value in attributes.items()
+    }
+
+
 @typechecked
 def get_new_radiation_graph(
     *,
@@ -1,8 +1,8 @@
 """Contains helper functions that are used throughout this repository."""
-import copy
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import networkx as nx
 from networkx.classes.graph import Graph
@@ -13,6 +13,15 @@ from typeguard import typechecked
 if TYPE_CHECKING:
     pass
 
+# Maps the name of each SNN graph to its (with_adaptation, with_radiation)
+# settings.
+GRAPH_ADAPTATION_RADIATION_SETTINGS: Dict[str, Tuple[bool, bool]] = {
+    "snn_algo_graph": (False, False),
+    "adapted_snn_graph": (True, False),
+    "rad_snn_algo_graph": (False, True),
+    "rad_adapted_snn_graph": (True, True),
+}
+
 
 @typechecked
 def generate_list_of_n_random_nrs(
@@ -143,14 +152,28 @@ def get_expected_stages(
     stage_index: int,
 ) -> List[int]:
     """Computes which stages should be expected at this stage of the
-    experiment."""
+    experiment.
+
+    Returns a new list, so the caller may modify it.
+    """
+    return list(get_expected_stages_tuple(stage_index=stage_index))
+
+
+@lru_cache(maxsize=None)
+def get_expected_stages_tuple(
+    *,
+    stage_index: int,
+) -> Tuple[int, ...]:
+    """Computes which stages should be expected at this stage of the
+    experiment, cached per stage index because it is computed for every
+    graph of every run."""
     expected_stages = list(range(1, stage_index + 1))
     # stage 3 is checked on completeness by looking if image files exist.
     if 3 in expected_stages:
         expected_stages.remove(3)
 
     # Sort and remove dupes.
-    return list(set(sorted(expected_stages)))
+    return tuple(sorted(set(expected_stages)))
 
 
 @typechecked
@@ -159,36 +182,38 @@ def dicts_are_equal(
 ) -> bool:
     """Determines whether two run configurations are equal or not."""
     if without_unique_id:
-        left_copy = copy.deepcopy(left)
-        right_copy = copy.deepcopy(right)
-        if "unique_id" in left_copy:
-            left_copy.pop("unique_id")
-        if "unique_id" in right_copy:
-            right_copy.pop("unique_id")
-        return left_copy == right_copy
+        # Compare the entries in place instead of comparing deep copies
+        # without the unique_id, and stop at the first differing value.
+        left_keys = left.keys() - {"unique_id"}
+        if left_keys != right.keys() - {"unique_id"}:
+            return False
+        return all(left[key] == right[key] for key in left_keys)
     return left == right
 
 
+@typechecked
+def get_adaptation_and_radiation_bools(
+    *, graph_name: str
+) -> Tuple[bool, bool]:
+    """Returns the (with_adaptation, with_radiation) settings of the graph
+    with the given name."""
+    if graph_name not in GRAPH_ADAPTATION_RADIATION_SETTINGS:
+        raise NotImplementedError(f"Error, {graph_name} is not supported.")
+    return GRAPH_ADAPTATION_RADIATION_SETTINGS[graph_name]
+
+
 @typechecked
 def get_with_adaptation_bool(*, graph_name: str) -> bool:
     """Returns True if the graph name belongs to a graph that has adaptation,
     returns False otherwise."""
-    if graph_name in ["adapted_snn_graph", "rad_adapted_snn_graph"]:
-        return True
-    if graph_name in ["snn_algo_graph", "rad_snn_algo_graph"]:
-        return False
-    raise NotImplementedError(f"Error, {graph_name} is not supported.")
+    return get_adaptation_and_radiation_bools(graph_name=graph_name)[0]
 
 
 @typechecked
 def get_with_radiation_bool(*, graph_name: str) -> bool:
     """Returns True if the graph name belongs to a graph that has radiation,
     returns False otherwise."""
-    if graph_name in ["rad_snn_algo_graph", "rad_adapted_snn_graph"]:
-        return True
-    if graph_name in ["snn_algo_graph", "adapted_snn_graph"]:
-        return False
-    raise NotImplementedError(f"Error, {graph_name} is not supported.")
+    return get_adaptation_and_radiation_bools(graph_name=graph_name)[1]
 
 
 def get_snn_graph_from_graphs_dict(
@@ -248,20 +273,22 @@ def get_rand_synapse_weights(
     neighbour_count: List[int] = [0] * len(input_graph.nodes)
     for synapse in simsnn_synapses:
         if (
-            synapse.pre.name[:5] == "rand_"
-            and synapse.post.name[:15] == "degree_receiver"
-            and synapse.post.name[-2:] == "_0"
+            synapse.pre.name.startswith("rand_")
+            and synapse.post.name.startswith("degree_receiver")
+            and synapse.post.name.endswith("_0")
         ):
             # print(f'{synapse.pre.name} - {synapse.post.name}')
             rand_neurons[int(synapse.pre.name[5:])] = synapse.w
             neighbour_count[int(synapse.pre.name[5:])] += 1
 
-    expected_isomorphic_hash: str = (
-        nx.algorithms.graph_hashing.weisfeiler_lehman_graph_hash(input_graph)
-    )
-
     for node_index in input_graph.nodes:
         if input_graph.degree(node_index) != neighbour_count[node_index]:
+            # Only hash the input graph to report the mismatch.
+            expected_isomorphic_hash: str = (
+                nx.algorithms.graph_hashing.weisfeiler_lehman_graph_hash(
+                    input_graph
+                )
+            )
             print(f"input_graph.degrees={input_graph.degree}")
             print(f"neighbour_count={neighbour_count}")
             print(f"expected_isomorphic_hash={expected_isomorphic_hash}")
@@ -1,9 +1,9 @@
 """Method used to perform checks on whether the input is loaded correctly."""
-from typing import Dict, List
+from typing import Dict
 
 from snnbackends.verify_nx_graphs import verify_completed_stages_list
-from typeguard import typechecked
 
+from snncompare.optional_decorators import typechecked_debug
 from snncompare.run_config.Run_config import Run_config
 
 from ..export_results.verify_stage_1_graphs import (
@@ -11,7 +11,7 @@ from ..export_results.verify_stage_1_graphs import (
 )
 
 
-@typechecked
+@typechecked_debug
 def nx_graphs_have_completed_stage(
     *,
     run_config: Run_config,
@@ -26,23 +26,21 @@ def nx_graphs_have_completed_stage(
     contains the required stage number.
     """
 
+    graphs_dict: Dict = results_nx_graphs["graphs_dict"]
+
     # Loop through expected graph names for this run_config.
     for graph_name in get_expected_stage_1_graph_names(run_config=run_config):
-        graph = results_nx_graphs["graphs_dict"][graph_name]
-        if graph_name not in results_nx_graphs["graphs_dict"]:
+        graph = graphs_dict.get(graph_name)
+        if graph is None:
             return False
-        if ("completed_stages") not in graph.graph:
+        completed_stages = graph.graph.get("completed_stages")
+        if completed_stages is None:
             return False
-        if not isinstance(
-            graph.graph["completed_stages"],
-            List,
-        ):
+        if not isinstance(completed_stages, list):
             raise TypeError(
                 "Error, completed stages parameter type is not a list."
             )
-        if stage_index not in graph.graph["completed_stages"]:
+        if stage_index not in completed_stages:
             return False
-        verify_completed_stages_list(
-            completed_stages=graph.graph["completed_stages"]
-        )
+        verify_completed_stages_list(completed_stages=completed_stages)
     return True
@@ -1,17 +1,24 @@
 """Helps importing and exporting."""
 
 import os
-from pathlib import Path
-from typing import List, Optional, Tuple, Union
+import time
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 
 import networkx as nx
 from typeguard import typechecked
 
+from snncompare.optional_decorators import typechecked_debug
+
 # if TYPE_CHECKING:
 from snncompare.run_config.Run_config import Run_config
 
+# Maps a directory to its modification time (in ns) and its filenames, as
+# they were when the directory was listed. Clear it to force a new listing.
+DIR_LISTING_CACHE: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
 
-@typechecked
+
+@typechecked_debug
 def prepare_target_file_output(
     *,
     output_dir: str,
@@ -37,12 +44,13 @@ def prepare_target_file_output(
         f"{output_dir}{isomorphic_hash}{additional_hashes}.json"
     )
 
-    if not Path(output_filepath).is_file():
+    output_file_exists: bool = os.path.isfile(output_filepath)
+    if not output_file_exists:
         create_relative_path(some_path=output_dir)
-    return Path(output_filepath).is_file(), output_filepath
+    return output_file_exists, output_filepath
 
 
-@typechecked
+@typechecked_debug
 def get_isomorphic_graph_hash(*, some_graph: nx.Graph) -> str:
     """Returns the hash of the isomorphic graph. Meaning all graphs that have
     the same shape, return the same hash string.
@@ -50,26 +58,76 @@ def get_isomorphic_graph_hash(*, some_graph: nx.Graph) -> str:
     An isomorphic graph is one that looks the same as another/has the
     same shape as another, (if you are blind to the node numbers).
     """
+    return get_isomorphic_hash_of_topology(
+        directed=some_graph.is_directed(),
+        nodes=tuple(some_graph.nodes),
+        edges=tuple(some_graph.edges),
+    )
+
+
+@lru_cache(maxsize=256)
+def get_isomorphic_hash_of_topology(
+    *,
+    directed: bool,
+    nodes: Tuple[Hashable, ...],
+    edges: Tuple[Tuple[Hashable, ...], ...],
+) -> str:
+    """Returns the isomorphic hash of the graph with the given nodes and edges.
+
+    The hash ignores the node and edge attributes, so it only depends
+    on the topology. The same input graph is hashed for every snn graph
+    and stage of a run configuration, so the hash is cached per
+    topology.
+    """
+    some_graph: nx.Graph = nx.DiGraph() if directed else nx.Graph()
+    some_graph.add_nodes_from(nodes)
+    some_graph.add_edges_from(edges)
     isomorphic_hash: str = (
         nx.algorithms.graph_hashing.weisfeiler_lehman_graph_hash(some_graph)
     )
     return isomorphic_hash
 
 
+@typechecked
+def get_filenames_in_dir(*, dirpath: str) -> List[str]:
+    """Returns the names of the files in a directory, in directory order.
+
+    Uses a single os.scandir, whose entries know their file type from
+    the directory listing, instead of an os.path.isfile stat per name.
+    The listing is cached until the modification time of the directory
+    changes, which happens when a file is added, removed or renamed.
+    Directories that were modified in the last second are not cached,
+    because a coarse modification time may not change for a file that
+    is added in the same second.
+    """
+    dir_mtime_ns: int = os.stat(dirpath).st_mtime_ns
+    cached_listing = DIR_LISTING_CACHE.get(dirpath)
+    if cached_listing is not None and cached_listing[0] == dir_mtime_ns:
+        return list(cached_listing[1])
+
+    with os.scandir(dirpath) as entries:
+        filenames: List[str] = [
+            entry.name for entry in entries if entry.is_file()
+        ]
+    if time.time_ns() - dir_mtime_ns > 1_000_000_000:
+        DIR_LISTING_CACHE[dirpath] = (dir_mtime_ns, tuple(filenames))
+    return filenames
+
+
 @typechecked
 def create_relative_path(*, some_path: str) -> None:
     """Exports Run_config to a json file."""
     absolute_path: str = f"{os.getcwd()}/{some_path}"
-    # Create subdirectory in results dir.
+    # Create subdirectory in results dir. A parallel run may create it at
+    # the same time, so an existing directory is not an error.
     if not os.path.exists(absolute_path):
-        # Path(absolute_path).mkdir(parents=True, exist_ok=True)
-        os.makedirs(absolute_path)
+        os.makedirs(absolute_path, exist_ok=True)
 
     if not os.path.exists(absolute_path):
         raise NotADirectoryError(f"{absolute_path} does not exist.")
 
 
-@typechecked
+@typechecked_debug
 def seed_rand_nrs_hash_file_exists(
     *,
     output_category: str,
@@ -90,10 +148,10 @@ def seed_rand_nrs_hash_file_exists(
         + f"{algorithm_parameter}/no_adaptation/{output_category}/"
         + f"{run_config.seed}.txt"
     )
-    return Path(output_path).is_file(), output_path
+    return os.path.isfile(output_path), output_path
 
 
-@typechecked
+@typechecked_debug
 def seed_rad_neurons_hash_file_exists(
     *,
     output_category: str,
@@ -123,10 +181,10 @@ def seed_rad_neurons_hash_file_exists(
             + f"{algorithm_parameter}/no_adaptation/{output_category}/"
             + f"{run_config.seed}.txt"
         )
-    return Path(output_path).is_file(), output_path
+    return os.path.isfile(output_path), output_path
 
 
-@typechecked
+@typechecked_debug
 def simsnn_files_exists_and_get_path(
     *,
     output_category: str,
@@ -224,10 +282,32 @@ def assert_has_one_element(*, some_list: List) -> None:
 @typechecked
 def file_contains_line(*, filepath: str, expected_line: str) -> bool:
     """Returns True if a file exists and contains a line at least once, False
-    otherwise."""
+    otherwise.
+
+    The lines are only read again if the modification time or size of
+    the file changed since it was last read.
+    """
+    file_stat: os.stat_result = os.stat(filepath)
+    return any(
+        expected_line in line
+        for line in get_lines_of_file_version(
+            filepath=filepath,
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+        )
+    )
+
+
+# pylint: disable=W0613
+@lru_cache(maxsize=64)
+def get_lines_of_file_version(
+    *, filepath: str, mtime_ns: int, size: int
+) -> Tuple[str, ...]:
+    """Returns the lines of a text file, cached per filepath, modification
+    time and file size.
+
+    The seed hash files are checked for every run config, and only
+    grow when a seed is added, which changes their size.
+    """
     with open(filepath, encoding="utf-8") as txt_file:
-        for _, line in enumerate(txt_file, 1):
-            if expected_line in line:
-                return True
-        txt_file.close()
-    return False
+        return tuple(txt_file)
@@ -75,16 +75,14 @@ def restore_nx_lif_neuron_and_synapse_objects(
 ) -> None:
     """Converts the edge and node attributes Synapse and nx_Lif back into their
     respective objects."""
-    for edge in graph.edges:
-        if "synapse" in graph.edges[edge].keys():
-            graph.edges[edge]["synapse"] = Synapse(
-                **graph.edges[edge]["synapse"]
-            )
-    for node in graph.nodes:
-        if "nx_lif" in graph.nodes[node].keys():
-            graph.nodes[node]["nx_lif"] = list(
+    for _, _, edge_attributes in graph.edges(data=True):
+        if "synapse" in edge_attributes:
+            edge_attributes["synapse"] = Synapse(**edge_attributes["synapse"])
+    for _, node_attributes in graph.nodes(data=True):
+        if "nx_lif" in node_attributes:
+            node_attributes["nx_lif"] = list(
                 map(
                     manually_create_lif_neuron,
-                    graph.nodes[node]["nx_lif"],
+                    node_attributes["nx_lif"],
                 )
             )
@@ -1,9 +1,15 @@
 """Parses the graph json files to recreate the graphs."""
 
+import os
+from typing import Set
+
 from typeguard import typechecked
 
+from snncompare.import_results.helper import get_filenames_in_dir
 from snncompare.run_config.Run_config import Run_config
 
+RUN_CONFIG_OUTPUT_DIR: str = "results/stage1/run_configs/"
+
 
 @typechecked
 def get_run_config_filepath(
@@ -12,6 +18,23 @@ def get_run_config_filepath(
 ) -> str:
     """Returns the run_config filepath as it is to be exported."""
 
-    relative_output_dir = "results/stage1/run_configs/"
+    relative_output_dir = RUN_CONFIG_OUTPUT_DIR
     json_filepath = relative_output_dir + run_config.unique_id + ".json"
     return json_filepath
+
+
+@typechecked
+def get_outputted_run_config_unique_ids() -> Set[str]:
+    """Returns the unique ids of the run configs of which the json file has
+    been outputted, based on a single listing of the run config directory.
+
+    Use this to filter many run configs at once, before checking their
+    other stage outputs one run config at a time.
+    """
+    if not os.path.isdir(RUN_CONFIG_OUTPUT_DIR):
+        return set()
+    return {
+        filename[: -len(".json")]
+        for filename in get_filenames_in_dir(dirpath=RUN_CONFIG_OUTPUT_DIR)
+        if filename.endswith(".json")
+    }
@@ -7,8 +7,7 @@
     radiation type, died neurons list without adaptation.
     radiation type, Died neurons list with adaptation.
 """
-import json
-from pathlib import Path
+import os
 from typing import Dict, List, Optional, Union
 
 import networkx as nx
@@ -39,7 +38,10 @@ from snncompare.import_results.load_stage1_results import (
 )
 from snncompare.run_config.Run_config import Run_config
 
-from .read_json import load_json_file_into_dict
+from .read_json import (
+    load_cached_json_file_into_dict,
+    load_json_file_into_dict,
+)
 
 
 @typechecked
@@ -56,6 +58,17 @@ def has_outputted_stage_1(
     - (optional) adapted snn graphs
     have been outputted for the isomorphic hash belonging to this run_config.
     """
+    # The input graph and run config files are the same with and without
+    # adaptation, so check them once, before the snn graphs are loaded.
+    if not has_outputted_input_graph(
+        input_graph=input_graph,
+    ):
+        return False
+
+    json_filepath: str = get_run_config_filepath(run_config=run_config)
+    if not os.path.isfile(json_filepath):
+        return False
+
     for with_adaptation in [False, True]:
         if not has_outputted_snn_graph(
             input_graph=input_graph,
@@ -64,14 +77,6 @@ def has_outputted_stage_1(
             stage_index=1,
         ):
             return False
-        if not has_outputted_input_graph(
-            input_graph=input_graph,
-        ):
-            return False
-
-        json_filepath: str = get_run_config_filepath(run_config=run_config)
-        if not Path(json_filepath).is_file():
-            return False
     return True
 
 
@@ -83,7 +88,7 @@ def has_outputted_input_graph(
     output_filepath: str = get_input_graph_output_filepath(
         input_graph=input_graph
     )
-    return Path(output_filepath).is_file()
+    return os.path.isfile(output_filepath)
 
 
 def has_outputted_snn_graph(
@@ -242,10 +247,11 @@ def load_simsnn_graph_from_file(
     stage_index: int,
 ) -> Simulator:
     """Loads the simsnn filepath and converts it into a simsnn graph file."""
-    # Read output JSON file into dict.
-    with open(stage_1_simsnn_filepath, encoding="utf-8") as json_file:
-        some_dict: Dict[str, List] = json.load(json_file)
-        json_file.close()
+    # Read output JSON file into dict. The same stage 1 file is loaded for
+    # the snn and its radiation variant, so the loaded dict is reused.
+    some_dict: Dict[str, List] = load_cached_json_file_into_dict(
+        json_filepath=stage_1_simsnn_filepath
+    )
 
     stage1_simsnn: Simulator = stage1_simsnn_graph_from_file_to_simulator(
         add_to_raster=True,
@@ -354,7 +360,7 @@ def load_snn_graph_stage_2(
 ) -> None:
     """Adds the spikes, I and V of an snn into a simsnn Simulator object."""
     # Verify the file exists.
-    if not Path(output_filepath).is_file():
+    if not os.path.isfile(output_filepath):
         raise FileExistsError(
             f"Error, filepath:{output_filepath} was not created."
         )
@@ -380,7 +386,7 @@ def add_stage4_results_from_file_to_snn(
 ) -> None:
     """Adds the spikes, I and V of an snn into a simsnn Simulator object."""
     # Verify the file exists.
-    if not Path(output_filepath).is_file():
+    if not os.path.isfile(output_filepath):
         raise FileExistsError(
             f"Error, filepath:{output_filepath} was not created."
         )
@@ -398,7 +404,7 @@ def add_stage7_failure_data_from_file_to_snn(
 ) -> None:
     """Adds the spikes, I and V of an snn into a simsnn Simulator object."""
     # Verify the file exists.
-    if not Path(output_filepath).is_file():
+    if not os.path.isfile(output_filepath):
         raise FileExistsError(
             f"Error, filepath:{output_filepath} was not created."
         )
@@ -5,6 +5,8 @@ Appears to also be used to partially convert json graphs back into nx
 graphs.
 """
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
@@ -66,3 +68,45 @@ def load_json_file_into_dict(
         the_dict = json.load(json_file)
         json_file.close()
     return the_dict
+
+
+@typechecked
+def load_cached_json_file_into_dict(
+    *,
+    json_filepath: str,
+) -> Dict:
+    """Loads a json file into dict from a filepath, and reuses the read file
+    content until the file is modified.
+
+    Use this for files that are loaded more than once, like the stage 1
+    snn files, which are loaded for both the snn and its radiation
+    variant. The cached content is decoded into a new dict on every
+    call, such that callers can not modify the cached file content.
+    Decoding is faster than a deepcopy of the decoded dict.
+    """
+    file_stat: os.stat_result = os.stat(json_filepath)
+    return json.loads(
+        read_json_file_version(
+            json_filepath=json_filepath,
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+        )
+    )
+
+
+# pylint: disable=W0613
+@lru_cache(maxsize=16)
+def read_json_file_version(
+    *,
+    json_filepath: str,
+    mtime_ns: int,
+    size: int,
+) -> str:
+    """Returns the content of a json file, cached per filepath, modification
+    time and file size.
+
+    The modification time and size are only used in the cache key, such
+    that a modified file is read again.
+    """
+    with open(json_filepath, encoding="utf-8") as json_file:
+        return json_file.read()
@@ -25,6 +25,9 @@ class Output_config:
         hover_info: Hover_info | None = None,
         graph_types: list[str] | None = None,
         dash_port: int | None = None,
+        parallel_runs: int | None = None,
+        skip_completed_runs: bool = False,
+        verbose: bool = False,
     ):
         """Stores run configuration settings for the exp_configriment."""
         self.verify_int_list_values(
@@ -59,6 +62,14 @@ class Output_config:
         self.graph_types: None | list[str] = graph_types
         self.dash_port: None | int = dash_port
 
+        if parallel_runs is not None and parallel_runs < 1:
+            raise ValueError(
+                f"Error, parallel_runs:{parallel_runs} should be at least 1."
+            )
+        self.parallel_runs: None | int = parallel_runs
+        self.skip_completed_runs: bool = skip_completed_runs
+        self.verbose: bool = verbose
+
     @typechecked
     def verify_int_list_values(
         self,
@@ -287,7 +298,7 @@ class Hover_info:
         """Throws an error if the user asks to show neuron properties in dash
         that are not in the neuron attributes."""
         for neuron_property in neuron_properties:
-            if neuron_property not in sample_neuron.__dict__.keys():
+            if neuron_property not in sample_neuron.__dict__:
                 raise KeyError(
                     f"Error, {neuron_property} does not exist in neuron "
                     f"attributes:{sample_neuron.__dict__.keys()}"
@@ -302,7 +313,7 @@ class Hover_info:
         """Throws an error if the user asks to show synapse properties in dash
         that are not in the synapse attributes."""
         for synapse_property in synapse_properties:
-            if synapse_property not in sample_synapse.__dict__.keys():
+            if synapse_property not in sample_synapse.__dict__:
                 raise KeyError(
                     f"Error, {synapse_property} does not exist in synapse "
                     f"attributes:{sample_synapse.__dict__.keys()}"
@@ -0,0 +1,43 @@
+"""Contains decorators that are only applied if an environment variable is
+set, such that their overhead stays out of regular experiment runs."""
+import os
+from typing import Callable, TypeVar
+
+from typeguard import typechecked
+
+Function = TypeVar("Function", bound=Callable[..., object])
+
+
+def _env_flag(name: str) -> bool:
+    """Returns True if the environment variable with the given name is set
+    to a non-empty value."""
+    return bool(os.environ.get(name))
+
+
+def typechecked_debug(func: Function) -> Function:
+    """Returns the typechecked function if the SNN_TYPECHECK environment
+    variable is set, and the unmodified function otherwise.
+
+    Use this instead of @typechecked on functions that are called per
+    node, edge or timestep, where the typeguard overhead of each call
+    adds up. The tests set SNN_TYPECHECK=1 in their conftest.py.
+    """
+    if _env_flag("SNN_TYPECHECK"):
+        return typechecked(func)
+    return func
+
+
+def time_if_profiling(func: Function) -> Function:
+    """Returns the function wrapped with customshowme.time if the
+    SNN_PROFILE environment variable is set, and the unmodified function
+    otherwise.
+
+    Set SNN_PROFILE=1 to print the duration of each stage.
+    """
+    if _env_flag("SNN_PROFILE"):
+        # Only import customshowme when profiling.
+        # pylint: disable=C0415
+        import customshowme
+
+        return customshowme.time(func)
+    return func
@@ -13,7 +13,7 @@ def get_min_max_synaptic_excitation_amplitude_lines(
     """Returns 2 lines with the minimum and maximum synaptic weight increase
     per simulation, that is found in the used exp_config."""
     lines: List[str] = []
-    if "change_syn" in exp_config.radiations.__dict__.keys():
+    if "change_syn" in exp_config.radiations.__dict__:
         if exp_config.radiations.excitatory == [
             True
         ] and exp_config.radiations.inhibitory == [False]:
@@ -43,7 +43,7 @@ def get_min_max_synaptic_excitation_lines(
     TODO: probability per timestep or per synapse.
     """
     lines: List[str] = []
-    if "change_syn" in exp_config.radiations.__dict__.keys():
+    if "change_syn" in exp_config.radiations.__dict__:
         if exp_config.radiations.excitatory == [
             True
         ] and exp_config.radiations.inhibitory == [False]:
@@ -76,7 +76,7 @@ def get_min_max_neuron_death_probability_procent(
     TODO: verify procent is procent.
     """
     lines: List[str] = []
-    if "neuron_death" in exp_config.radiations.__dict__.keys():
+    if "neuron_death" in exp_config.radiations.__dict__:
         if exp_config.radiations.excitatory == [
             False
         ] and exp_config.radiations.inhibitory == [True]:
@@ -102,7 +102,7 @@ def get_neuron_death_probabilities_procent(
     """Returns 1 latex line with the latex code for the neuron death
     probabilities."""
     lines: List[str] = []
-    if "neuron_death" in exp_config.radiations.__dict__.keys():
+    if "neuron_death" in exp_config.radiations.__dict__:
         if exp_config.radiations.excitatory == [
             False
         ] and exp_config.radiations.inhibitory == [True]:
@@ -125,7 +125,7 @@ def get_nr_of_synaptic_weight_increases(
     TODO: probability per timestep or per synapse.
     """
     lines: List[str] = []
-    if "change_syn" in exp_config.radiations.__dict__.keys():
+    if "change_syn" in exp_config.radiations.__dict__:
         if exp_config.radiations.excitatory == [
             True
         ] and exp_config.radiations.inhibitory == [False]:
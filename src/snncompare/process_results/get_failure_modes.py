@@ -3,6 +3,7 @@ graphs."""
 from typing import Dict, List, Tuple, Union
 
 import networkx as nx
+import numpy as np
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
@@ -33,7 +34,7 @@ def add_failure_modes_to_graph(
     # Get adapted unradiated SNN.
     adapted_unradiated_snn: Simulator = snn_graphs["adapted_snn_graph"]
 
-    unradiated_spikes, unradiated_I, _ = get_unradiated_spike_list(
+    unradiated_spikes, unradiated_I = get_unradiated_spike_list(
         adapted_unradiated_snn=adapted_unradiated_snn,
         run_config=run_config,
         snn_graphs=snn_graphs,
@@ -77,7 +78,7 @@ def store_incorrect_spike(
 
     TODO: rename for its dual use case.
     """
-    if t not in failures.keys():
+    if t not in failures:
         failures[t] = []
     failures[t].append(neuron_name)
 
@@ -88,26 +89,19 @@ def get_unradiated_spike_list(
     adapted_unradiated_snn: Simulator,
     run_config: Run_config,
     snn_graphs: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
-) -> Tuple[List[List[bool]], List[List[float]], List[List[float]]]:
-    """Get the boolean list of spikes for the unradiated snn.
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the boolean array of spikes, and the current array, for the
+    unradiated snn. Both arrays have shape [timesteps, neurons].
 
     This function may be called directly after simulating the SNNs, or
     after their behaviour has been stored to a file. That is why it
     first checks if the spikes are still in the incoming snn. Otherwise,
-    it loads the spike behaviour from file.
+    it loads the spike behaviour from file. The arrays are returned as
+    they are stored in the simsnn raster and multimeter, instead of
+    being copied into nested lists of Python objects per timestep.
     """
-    if "spikes" in adapted_unradiated_snn.raster.__dict__.keys():
-        # If spikes are (still) stored in incoming object, load them directly.
-        unradiated_spikes: List[
-            List[bool]
-        ] = adapted_unradiated_snn.raster.spikes.tolist()
-        unradiated_I: List[
-            List[float]
-        ] = adapted_unradiated_snn.multimeter.I.tolist()
-        unradiated_V: List[
-            List[float]
-        ] = adapted_unradiated_snn.multimeter.V.tolist()
-    else:  # Load the data from the snn behaviour file.
+    if "spikes" not in adapted_unradiated_snn.raster.__dict__:
+        # Load the data from the snn behaviour file.
         # Get boilerplate data to receive the snn behaviour.
         _, rand_nrs_hash = get_rand_nrs_and_hash(
             input_graph=snn_graphs["input_graph"]
@@ -132,11 +126,12 @@ def get_unradiated_spike_list(
                 "Error, was not able to find the SNN propagation results"
                 + f" at:{simsnn_filepath}."
             )
-        # Store the boolean spike list for the unradiated snn.
-        unradiated_spikes = adapted_unradiated_snn.raster.spikes.tolist()
-        unradiated_I = adapted_unradiated_snn.multimeter.I.tolist()
-        unradiated_V = adapted_unradiated_snn.multimeter.V.tolist()
-    return unradiated_spikes, unradiated_I, unradiated_V
+    # Return the boolean spike array and current array of the unradiated snn.
+    unradiated_spikes: np.ndarray = np.asarray(
+        adapted_unradiated_snn.raster.spikes
+    )
+    unradiated_I: np.ndarray = np.asarray(adapted_unradiated_snn.multimeter.I)
+    return unradiated_spikes, unradiated_I
 
 
 @typechecked
@@ -144,8 +139,8 @@ def get_incorrect_spikes(
     *,
     adapted_unradiated_snn: Simulator,
     snn_graphs: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
-    unradiated_I: List[List[float]],
-    unradiated_spikes: List[List[bool]],
+    unradiated_I: np.ndarray,
+    unradiated_spikes: np.ndarray,
 ) -> Tuple[
     Dict[int, List[str]],
     Dict[int, List[str]],
@@ -156,54 +151,83 @@ def get_incorrect_spikes(
     adapted SNN shows a different spike behaviour than the unradiated adapted
     SNN."""
 
-    # Create the dictionaries with timestep and neuron names for the neurons
-    # in the radiated SNN that behave different from those in the unadapted
-    # snn.
-    incorrectly_spikes: Dict[int, List[str]] = {}
-    incorrectly_silent: Dict[int, List[str]] = {}
-
-    excitatory_delta_u: Dict[int, List[str]] = {}
-    inhibitory_delta_u: Dict[int, List[str]] = {}
-
     # Get adapted radiated SNN.
     adapted_radiated_snn: Simulator = snn_graphs["rad_adapted_snn_graph"]
-    radiated_spikes: List[
-        List[bool]
-    ] = adapted_radiated_snn.raster.spikes.tolist()
-    radiated_I: List[List[float]] = adapted_radiated_snn.multimeter.I.tolist()
+    return compare_spike_behaviour(
+        neuron_names=[
+            neuron.name for neuron in adapted_unradiated_snn.network.nodes
+        ],
+        radiated_I=np.asarray(adapted_radiated_snn.multimeter.I),
+        radiated_spikes=np.asarray(adapted_radiated_snn.raster.spikes),
+        unradiated_I=unradiated_I,
+        unradiated_spikes=unradiated_spikes,
+    )
 
-    # Loop over timesteps
-    # Loop over neurons
-    for neuron_index, neuron_name in enumerate(
-        list(
-            map(
-                lambda neuron: neuron.name,
-                adapted_unradiated_snn.network.nodes,
-            )
-        )
-    ):
-        for t, unradiated_spikes_at_t in enumerate(unradiated_spikes):
-            add_neurons_with_spike_difference(
-                incorrectly_spikes=incorrectly_spikes,
-                incorrectly_silent=incorrectly_silent,
-                neuron_index=neuron_index,
-                neuron_name=neuron_name,
-                radiated_spikes=radiated_spikes,
-                t=t,
-                unradiated_spikes=unradiated_spikes,
-                unradiated_spikes_at_t=unradiated_spikes_at_t,
-            )
 
-        for t, unradiated_I_at_t in enumerate(unradiated_I):
-            add_neurons_with_u_difference(
-                excitatory_delta_u=excitatory_delta_u,
-                inhibitory_delta_u=inhibitory_delta_u,
-                neuron_index=neuron_index,
-                neuron_name=neuron_name,
-                radiated_I=radiated_I,
-                t=t,
-                unradiated_I_at_t=unradiated_I_at_t,
-            )
+@typechecked
+def compare_spike_behaviour(
+    *,
+    neuron_names: List[str],
+    radiated_I: np.ndarray,
+    radiated_spikes: np.ndarray,
+    unradiated_I: np.ndarray,
+    unradiated_spikes: np.ndarray,
+) -> Tuple[
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+]:
+    """Returns the incorrectly spiking, incorrectly silent, excitatory delta u
+    and inhibitory delta u neuron names per timestep, of the radiated SNN
+    w.r.t. the unradiated SNN.
+
+    The spike and current arrays have shape [timesteps, neurons]. Only
+    the timesteps that are stored for both SNNs are compared, and an
+    empty array has no timesteps.
+    """
+    # Give empty arrays the shape [0, neurons], such that they can be
+    # compared with the arrays of the other SNN.
+    nr_of_neurons: int = len(neuron_names)
+    radiated_spikes = np.asarray(radiated_spikes, dtype=bool).reshape(
+        -1, nr_of_neurons
+    )
+    unradiated_spikes = np.asarray(unradiated_spikes, dtype=bool).reshape(
+        -1, nr_of_neurons
+    )
+    radiated_I = np.asarray(radiated_I).reshape(-1, nr_of_neurons)
+    unradiated_I = np.asarray(unradiated_I).reshape(-1, nr_of_neurons)
+
+    # Only compare the timesteps that are stored for both SNNs.
+    spike_duration: int = min(len(unradiated_spikes), len(radiated_spikes))
+    unradiated_spikes = unradiated_spikes[:spike_duration]
+    spike_differs: np.ndarray = (
+        unradiated_spikes != radiated_spikes[:spike_duration]
+    )
+
+    current_duration: int = min(len(unradiated_I), len(radiated_I))
+    unradiated_I = unradiated_I[:current_duration]
+    radiated_I = radiated_I[:current_duration]
+
+    # Create the dictionaries with timestep and neuron names for the neurons
+    # in the radiated SNN that behave different from those in the unadapted
+    # snn.
+    incorrectly_spikes: Dict[int, List[str]] = get_neuron_names_per_timestep(
+        neuron_mask=spike_differs & ~unradiated_spikes,
+        neuron_names=neuron_names,
+    )
+    incorrectly_silent: Dict[int, List[str]] = get_neuron_names_per_timestep(
+        neuron_mask=spike_differs & unradiated_spikes,
+        neuron_names=neuron_names,
+    )
+    excitatory_delta_u: Dict[int, List[str]] = get_neuron_names_per_timestep(
+        neuron_mask=unradiated_I < radiated_I,
+        neuron_names=neuron_names,
+    )
+    inhibitory_delta_u: Dict[int, List[str]] = get_neuron_names_per_timestep(
+        neuron_mask=unradiated_I > radiated_I,
+        neuron_names=neuron_names,
+    )
     return (
         incorrectly_spikes,
         incorrectly_silent,
@@ -213,73 +237,23 @@ def get_incorrect_spikes(
 
 
 @typechecked
-def add_neurons_with_spike_difference(
+def get_neuron_names_per_timestep(
     *,
-    incorrectly_spikes: Dict[int, List[str]],
-    incorrectly_silent: Dict[int, List[str]],
-    neuron_index: int,
-    neuron_name: str,
-    radiated_spikes: List[List[bool]],
-    t: int,
-    unradiated_spikes: List[List[bool]],
-    unradiated_spikes_at_t: List[bool],
-) -> None:
-    """Stores the neurons that show alternative spike behaviour."""
-    # Check if a spike boolean is stored for each timestep.
-    if t < len(radiated_spikes):
-        # Check if the unradiated neuron behaves different than the
-        # radiated neuron.
-        if (
-            unradiated_spikes_at_t[neuron_index]
-            != radiated_spikes[t][neuron_index]
-        ):
-            # pylint: disable=R1736
-            if unradiated_spikes[t][neuron_index]:
-                store_incorrect_spike(
-                    failures=incorrectly_silent,
-                    neuron_name=neuron_name,
-                    t=t,
-                )
-            else:
-                store_incorrect_spike(
-                    failures=incorrectly_spikes,
-                    neuron_name=neuron_name,
-                    t=t,
-                )
-    sort_lists_in_dict_values(some_dict=incorrectly_silent)
-    sort_lists_in_dict_values(some_dict=incorrectly_spikes)
-
-
-@typechecked
-def add_neurons_with_u_difference(
-    *,
-    excitatory_delta_u: Dict[int, List[str]],
-    inhibitory_delta_u: Dict[int, List[str]],
-    neuron_index: int,
-    neuron_name: str,
-    radiated_I: List[List[float]],
-    t: int,
-    unradiated_I_at_t: List[float],
-) -> None:
-    """Stores the neurons that show alternative spike behaviour."""
-    # Check if a spike boolean is stored for each timestep.
-    if t < len(radiated_I):
-        # Check if the unradiated neuron behaves different than the
-        # radiated neuron.
-        if unradiated_I_at_t[neuron_index] < radiated_I[t][neuron_index]:
-            store_incorrect_spike(
-                failures=excitatory_delta_u,
-                neuron_name=neuron_name,
-                t=t,
-            )
-        elif unradiated_I_at_t[neuron_index] > radiated_I[t][neuron_index]:
-            store_incorrect_spike(
-                failures=inhibitory_delta_u,
-                neuron_name=neuron_name,
-                t=t,
-            )
-    sort_lists_in_dict_values(some_dict=excitatory_delta_u)
-    sort_lists_in_dict_values(some_dict=inhibitory_delta_u)
+    neuron_mask: np.ndarray,
+    neuron_names: List[str],
+) -> Dict[int, List[str]]:
+    """Returns the sorted list of names of the neurons for which the
+    [timesteps, neurons] mask is True, per timestep at which the mask is
+    True for at least one neuron."""
+    neuron_names_per_timestep: Dict[int, List[str]] = {}
+    for t, neuron_index in zip(*np.nonzero(neuron_mask)):
+        store_incorrect_spike(
+            failures=neuron_names_per_timestep,
+            neuron_name=neuron_names[neuron_index],
+            t=int(t),
+        )
+    sort_lists_in_dict_values(some_dict=neuron_names_per_timestep)
+    return neuron_names_per_timestep
 
 
 @typechecked
@@ -169,7 +169,7 @@ def convert_table_dict_to_table(
     for timestep, failure_modes in table.items():
         new_row: List[Union[List[str], str]] = [str(timestep)]
         for adaptation_name in adaptation_names:
-            if adaptation_name not in failure_modes.keys():
+            if adaptation_name not in failure_modes:
                 new_row.append("")
             else:
                 new_row.append(failure_modes[adaptation_name])
@@ -24,9 +24,8 @@ from snncompare.simulation.stage2_sim import stage_2_or_4_graph_exists_already
 
 from ..helper import (
     add_stage_completion_to_graph,
+    get_adaptation_and_radiation_bools,
     get_expected_stages,
-    get_with_adaptation_bool,
-    get_with_radiation_bool,
 )
 from ..import_results.check_completed_stages import (
     nx_graphs_have_completed_stage,
@@ -43,23 +42,23 @@ def set_results(
 ) -> bool:
     """Gets the results for the algorithms that have been ran."""
     for algo_name, algo_settings in run_config.algorithm.items():
-        if algo_name == "MDSA":
-            if isinstance(algo_settings["m_val"], int):
-                return perform_mdsa_results_computation_if_needed(
-                    exp_config=exp_config,
-                    m_val=algo_settings["m_val"],
-                    output_config=output_config,
-                    run_config=run_config,
-                    stage_2_graphs=stage_2_graphs,
-                )
+        if algo_name != "MDSA":
+            raise NotImplementedError(
+                f"Error, algo_name:{algo_name} is not (yet) supported."
+            )
+        if not isinstance(algo_settings["m_val"], int):
             # pylint: disable=R0801
             raise TypeError(
                 "Error, m_val setting is not of type int:"
                 f'{type(algo_settings["m_val"])}'
                 f'm_val={algo_settings["m_val"]}'
             )
-        raise NotImplementedError(
-            f"Error, algo_name:{algo_name} is not (yet) supported."
+        return perform_mdsa_results_computation_if_needed(
+            exp_config=exp_config,
+            m_val=algo_settings["m_val"],
+            output_config=output_config,
+            run_config=run_config,
+            stage_2_graphs=stage_2_graphs,
         )
     return False
 
@@ -86,12 +85,12 @@ def perform_mdsa_results_computation_if_needed(
             graph = snn
         # pylint: disable=R0801
         if graph_name != "input_graph":
-            with_adaptation: bool = get_with_adaptation_bool(
-                graph_name=graph_name
-            )
-            with_radiation: bool = get_with_radiation_bool(
-                graph_name=graph_name
-            )
+            with_adaptation: bool
+            with_radiation: bool
+            (
+                with_adaptation,
+                with_radiation,
+            ) = get_adaptation_and_radiation_bools(graph_name=graph_name)
 
             if not stage_2_or_4_graph_exists_already(
                 input_graph=stage_2_graphs["input_graph"],
@@ -13,6 +13,7 @@ from snncompare.export_results.output_stage1_configs_and_input_graph import (
 )
 from snncompare.helper import get_snn_graph_from_graphs_dict
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.optional_decorators import typechecked_debug
 from snncompare.run_config.Run_config import Run_config
 
 
@@ -32,7 +33,7 @@ def assert_has_outputted_stage_2_or_4(
         raise FileNotFoundError("Error, stage 4 results were not outputted.")
 
 
-@typechecked
+@typechecked_debug
 def has_outputted_stage_2_or_4(
     *,
     graphs_dict: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
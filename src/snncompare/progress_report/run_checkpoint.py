@@ -0,0 +1,92 @@
+"""Stores and loads which run configurations of an experiment have been
+completed, such that an interrupted experiment can be resumed."""
+
+import json
+import os
+from typing import List
+
+from typeguard import typechecked
+
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.import_results.helper import create_relative_path
+from snncompare.import_results.read_json import load_json_file_into_dict
+from snncompare.optional_config.Output_config import Output_config
+from snncompare.run_config.Run_config import Run_config
+
+
+@typechecked
+def get_checkpoint_filepath(*, exp_config: Exp_config) -> str:
+    """Returns the filepath of the checkpoint of the experiment config.
+
+    The checkpoint is named after the unique id of the experiment
+    config, so a changed experiment config does not reuse it.
+    """
+    return f"results/checkpoints/{exp_config.unique_id}.json"
+
+
+@typechecked
+def load_completed_run_config_ids(*, exp_config: Exp_config) -> List[str]:
+    """Returns the unique ids of the run configs that have been completed for
+    this experiment config, or an empty list if there is no checkpoint."""
+    checkpoint_filepath: str = get_checkpoint_filepath(exp_config=exp_config)
+    if not os.path.isfile(checkpoint_filepath):
+        return []
+    return load_json_file_into_dict(json_filepath=checkpoint_filepath)[
+        "completed_run_config_ids"
+    ]
+
+
+@typechecked
+def store_completed_run_config_ids(
+    *,
+    completed_run_config_ids: List[str],
+    exp_config: Exp_config,
+) -> None:
+    """Writes the unique ids of the completed run configs to the checkpoint of
+    this experiment config.
+
+    The checkpoint is first written to a temporary file which then
+    replaces the checkpoint, such that an interruption never leaves a
+    partially written checkpoint.
+    """
+    checkpoint_filepath: str = get_checkpoint_filepath(exp_config=exp_config)
+    create_relative_path(some_path=os.path.dirname(checkpoint_filepath))
+    temporary_filepath: str = f"{checkpoint_filepath}.tmp"
+    with open(temporary_filepath, "w", encoding="utf-8") as checkpoint_file:
+        json.dump(
+            {"completed_run_config_ids": completed_run_config_ids},
+            checkpoint_file,
+            indent=4,
+        )
+    os.replace(temporary_filepath, checkpoint_filepath)
+
+
+@typechecked
+def get_run_configs_to_perform(
+    *,
+    completed_run_config_ids: List[str],
+    output_config: Output_config,
+    run_configs: List[Run_config],
+) -> List[Run_config]:
+    """Returns the run configs that should be performed, which excludes the
+    completed run configs if --skip-completed-runs is set.
+
+    The checkpoint does not record which stages were recreated or which
+    images were exported. It is therefore ignored if stages are
+    recreated or images are exported, such that those runs are
+    performed again.
+    """
+    if not output_config.skip_completed_runs:
+        return run_configs
+    if output_config.recreate_stages or output_config.export_types:
+        print(
+            "Not skipping the completed run configs, because stages are "
+            + "recreated or images are exported."
+        )
+        return run_configs
+    skipped_run_config_ids = set(completed_run_config_ids)
+    return [
+        run_config
+        for run_config in run_configs
+        if run_config.unique_id not in skipped_run_config_ids
+    ]
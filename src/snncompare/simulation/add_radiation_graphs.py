@@ -21,11 +21,11 @@ def ensure_empty_rad_snns_exist(
     """Copies the un-radiated snn graph into the radiated snn graph, for
     simulation."""
 
-    if "rad_snn_algo_graph" not in stage_1_graphs.keys():
+    if "rad_snn_algo_graph" not in stage_1_graphs:
         stage_1_graphs["rad_snn_algo_graph"] = copy.deepcopy(
             stage_1_graphs["snn_algo_graph"]
         )
-    if "rad_adapted_snn_graph" not in stage_1_graphs.keys():
+    if "rad_adapted_snn_graph" not in stage_1_graphs:
         stage_1_graphs["rad_adapted_snn_graph"] = copy.deepcopy(
             stage_1_graphs["adapted_snn_graph"]
         )
@@ -1,5 +1,6 @@
 """Simulates the SNN graphs and returns a deep copy of the graph per
 timestep."""
+import logging
 from typing import Dict, Tuple, Union
 
 import networkx as nx
@@ -22,12 +23,13 @@ from snncompare.run_config.Run_config import Run_config
 
 from ..helper import (
     add_stage_completion_to_graph,
+    get_adaptation_and_radiation_bools,
     get_max_sim_duration,
     get_rand_synapse_weights,
-    get_with_adaptation_bool,
-    get_with_radiation_bool,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @typechecked
 def sim_graphs(
@@ -41,17 +43,24 @@ def sim_graphs(
     :param stage_1_graphs: Dict:
     """
 
+    # The simulation duration only depends on the input graph and algorithm,
+    # so it is the same for all snn graphs of this run config.
+    sim_duration: int = get_max_sim_duration(
+        input_graph=stage_1_graphs["input_graph"],
+        run_config=run_config,
+    )
+
     # TODO: ensure order unradiated first.
     for graph_name, snn in stage_1_graphs.items():
         # Derive the adaptation setting for this graph.
 
         if graph_name != "input_graph":
-            with_adaptation: bool = get_with_adaptation_bool(
-                graph_name=graph_name
-            )
-            with_radiation: bool = get_with_radiation_bool(
-                graph_name=graph_name
-            )
+            with_adaptation: bool
+            with_radiation: bool
+            (
+                with_adaptation,
+                with_radiation,
+            ) = get_adaptation_and_radiation_bools(graph_name=graph_name)
 
             next_action: str = simulate_load_or_skip(
                 output_config=output_config,
@@ -61,9 +70,9 @@ def sim_graphs(
                 with_radiation=with_radiation,
             )
             if next_action == "Simulate":
-                print(f"graph_name={graph_name} - simulating.")
+                logger.debug("graph_name=%s - simulating.", graph_name)
 
-                if graph_name[:4] == "rad_":
+                if graph_name.startswith("rad_"):
                     unradiated_graph: Simulator = stage_1_graphs[
                         graph_name[4:]
                     ]
@@ -77,16 +86,16 @@ def sim_graphs(
                         snn=snn,
                     )
                 sim_snn(
-                    input_graph=stage_1_graphs["input_graph"],
                     snn=snn,
                     run_config=run_config,
+                    sim_duration=sim_duration,
                 )
                 add_stage_completion_to_graph(
                     snn=stage_1_graphs[graph_name], stage_index=2
                 )
 
             elif next_action == "Load":
-                print(f"graph_name={graph_name} - loading.")
+                logger.debug("graph_name=%s - loading.", graph_name)
                 stage_1_graphs[graph_name] = load_simsnn_graphs(
                     run_config=run_config,
                     input_graph=stage_1_graphs["input_graph"],
@@ -102,7 +111,7 @@ def sim_graphs(
                     ].network.synapses,
                 )
             elif next_action == "Skip":
-                print("Skip.")
+                logger.debug("graph_name=%s - skipping.", graph_name)
             else:
                 raise ValueError(
                     f"Error, next action unexpected:{next_action}"
@@ -215,20 +224,15 @@ def stage_2_or_4_graph_exists_already(
 @typechecked
 def sim_snn(
     *,
-    input_graph: nx.Graph,
     snn: Union[nx.DiGraph, Simulator],
     run_config: Run_config,
+    sim_duration: int,
 ) -> None:
     """Simulates the snn graphs and makes a deep copy for each timestep.
 
     :param stage_1_graphs: Dict:
     """
-    sim_duration: int
     if run_config.simulator == "nx":
-        sim_duration = get_max_sim_duration(
-            input_graph=input_graph,
-            run_config=run_config,
-        )
         if not isinstance(snn, nx.DiGraph):
             raise TypeError(
                 "Error, snn_graph:{graph_name} was not of the"
@@ -242,10 +246,6 @@ def sim_snn(
             sim_duration=sim_duration,
         )
     elif run_config.simulator == "simsnn":
-        sim_duration = get_max_sim_duration(
-            input_graph=input_graph,
-            run_config=run_config,
-        )
         if not isinstance(snn, Simulator):
             raise TypeError(
                 "Error, snn should be of type Simulator, it was:"
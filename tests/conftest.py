@@ -1,11 +1,23 @@
 """Configuration for pytest to automatically collect types.
 
 Thanks to Guilherme Salgado.
+
+Collecting the types profiles every function call, which slows the tests
+down considerably, so it only happens if the SNN_COLLECT_TYPES
+environment variable is set.
+
+The functions that are only typechecked if the SNN_TYPECHECK environment
+variable is set are always typechecked in the tests. It is set here,
+before the tests import snncompare.
 """
+import os
 from typing import Any, Iterator
 
 import pytest
-from pyannotate_runtime import collect_types
+
+os.environ.setdefault("SNN_TYPECHECK", "1")
+
+COLLECT_TYPES: bool = bool(os.environ.get("SNN_COLLECT_TYPES"))
 
 
 # pylint: disable=W0613
@@ -16,14 +28,19 @@ def pytest_collection_finish(*, session: Any) -> None:  # type:ignore[misc]
     collected.  This gives gevent a chance to monkey patch the world
     before importing pyannotate.
     """
+    if COLLECT_TYPES:
+        # pylint: disable=C0415
+        from pyannotate_runtime import collect_types
 
-    collect_types.init_types_collection()
+        collect_types.init_types_collection()
 
 
 # pylint: disable=W0613
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=COLLECT_TYPES)
 def collect_types_fixture() -> Iterator:
-    """Performs unknown activity."""
+    """Collects the types of the function calls made during a test."""
+    # pylint: disable=C0415
+    from pyannotate_runtime import collect_types
 
     collect_types.start()
     yield
@@ -36,5 +53,9 @@ def pytest_sessionfinish(  # type:ignore[misc]
     session: Any,
     exitstatus: Any,
 ) -> None:
-    """Performs unknown activity."""
-    collect_types.dump_stats("type_info.json")
+    """Writes the collected types to type_info.json."""
+    if COLLECT_TYPES:
+        # pylint: disable=C0415
+        from pyannotate_runtime import collect_types
+
+        collect_types.dump_stats("type_info.json")
@@ -1,15 +1,12 @@
 """Verifies the Supported_experiment_settings object catches invalid
 min_max_graphs specifications."""
 # pylint: disable=R0801
-import copy
+import pickle  # nosec
 import unittest
 
 from typeguard import typechecked
 
-from snncompare.exp_config.Exp_config import (
-    Supported_experiment_settings,
-    verify_exp_config,
-)
+from snncompare.exp_config.Exp_config import verify_exp_config
 from tests.exp_config.exp_config.test_generic_experiment_settings import (
     adap_sets,
     rad_sets,
@@ -18,6 +15,12 @@ from tests.exp_config.exp_config.test_generic_experiment_settings import (
     with_adaptation_with_radiation,
 )
 
+# Pickled once per module, because unittest creates a test object per test.
+# Loading a pickled copy is faster than a deepcopy per test.
+WITH_ADAPTATION_WITH_RADIATION_PICKLE: bytes = pickle.dumps(
+    with_adaptation_with_radiation, protocol=5
+)
+
 
 class Test_min_max_graphs_settings(unittest.TestCase):
     """Tests whether the verify_exp_config_types function catches invalid
@@ -27,7 +30,9 @@ class Test_min_max_graphs_settings(unittest.TestCase):
     @typechecked
     def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
         super().__init__(*args, **kwargs)
-        self.supp_exp_config = Supported_experiment_settings()
+        # Reuse the module level supported settings instead of creating them
+        # again for every test.
+        self.supp_exp_config = supp_exp_config
         self.valid_min_max_graphs = self.supp_exp_config.min_max_graphs
 
         self.invalid_min_max_graphs_value = {
@@ -35,18 +40,22 @@ class Test_min_max_graphs_settings(unittest.TestCase):
             + " floats",
         }
 
-        self.supp_exp_config = supp_exp_config
         self.adap_sets = adap_sets
         self.rad_sets = rad_sets
         self.with_adaptation_with_radiation = with_adaptation_with_radiation
+        self.with_adaptation_with_radiation_pickle: bytes = (
+            WITH_ADAPTATION_WITH_RADIATION_PICKLE
+        )
 
     @typechecked
     def test_error_is_thrown_if_min_max_graphs_key_is_missing(self) -> None:
         """Verifies an exception is thrown if the min_max_graphs key is missing
         from the configuration settings dictionary."""
 
-        # Create deepcopy of configuration settings.
-        exp_config = copy.deepcopy(self.with_adaptation_with_radiation)
+        # Create a copy of configuration settings.
+        exp_config = pickle.loads(  # nosec
+            self.with_adaptation_with_radiation_pickle
+        )
         # Remove key and value of m.
 
         exp_config.pop("min_max_graphs")
@@ -75,8 +84,10 @@ class Test_min_max_graphs_settings(unittest.TestCase):
         is expected).
         """
 
-        # Create deepcopy of configuration settings.
-        exp_config = copy.deepcopy(self.with_adaptation_with_radiation)
+        # Create a copy of configuration settings.
+        exp_config = pickle.loads(  # nosec
+            self.with_adaptation_with_radiation_pickle
+        )
         expected_type = type(self.supp_exp_config.min_max_graphs)
 
         # Verify it throws an error on None and string.
@@ -96,8 +107,10 @@ class Test_min_max_graphs_settings(unittest.TestCase):
         """Verifies an exception is thrown if the min_max_graphs dictionary
         value is lower than the supported range of min_max_graphs values
         permits."""
-        # Create deepcopy of configuration settings.
-        exp_config = copy.deepcopy(self.with_adaptation_with_radiation)
+        # Create a copy of configuration settings.
+        exp_config = pickle.loads(  # nosec
+            self.with_adaptation_with_radiation_pickle
+        )
         # Set negative value of min_max_graphs in copy.
         exp_config.min_max_graphs = -2
 
@@ -119,8 +132,10 @@ class Test_min_max_graphs_settings(unittest.TestCase):
         """Verifies an exception is thrown if the min_max_graphs dictionary
         value is higher than the supported range of min_max_graphs values
         permits."""
-        # Create deepcopy of configuration settings.
-        exp_config = copy.deepcopy(self.with_adaptation_with_radiation)
+        # Create a copy of configuration settings.
+        exp_config = pickle.loads(  # nosec
+            self.with_adaptation_with_radiation_pickle
+        )
         # Set negative value of min_max_graphs in copy.
         exp_config.min_max_graphs = 50
 
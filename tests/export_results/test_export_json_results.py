@@ -0,0 +1,92 @@
+"""Verifies the json files are written atomically, and that a line is only
+appended to a shared text file once, also by parallel worker processes."""
+import json
+import multiprocessing
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from unittest import mock
+
+from typeguard import typechecked
+
+from snncompare.export_results.export_json_results import (
+    append_line_if_missing,
+    set_shared_file_lock,
+    write_to_json,
+)
+
+
+@typechecked
+def append_hashes(*, filepath: str) -> None:
+    """Appends the same hashes to a file a number of times."""
+    for i in range(50):
+        append_line_if_missing(filepath=filepath, line=f"hash_{i % 7}")
+
+
+class Test_export_json_results(unittest.TestCase):
+    """Tests whether write_to_json replaces the output file atomically, and
+    whether append_line_if_missing does not append duplicate lines."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    @typechecked
+    def test_write_to_json_replaces_the_output_file(self) -> None:
+        """Verifies the json is written to a temporary file, which then
+        replaces the output file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_filepath: str = f"{tmp_dir}/some.json"
+            write_to_json(output_filepath=output_filepath, some_dict={"a": 1})
+            with mock.patch(
+                "snncompare.export_results.export_json_results.os.replace",
+                wraps=os.replace,
+            ) as replace:
+                write_to_json(
+                    output_filepath=output_filepath, some_dict={"a": 2}
+                )
+            replace.assert_called_once_with(
+                f"{output_filepath}.{os.getpid()}.tmp", output_filepath
+            )
+            with open(output_filepath, encoding="utf-8") as json_file:
+                self.assertEqual(json.load(json_file), {"a": 2})
+            # The temporary file does not remain.
+            self.assertEqual(os.listdir(tmp_dir), ["some.json"])
+
+    @typechecked
+    def test_append_line_if_missing_appends_once(self) -> None:
+        """Verifies a line is only appended if the file does not contain it
+        yet."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath: str = f"{tmp_dir}/hashes.txt"
+            append_line_if_missing(filepath=filepath, line="first")
+            append_line_if_missing(filepath=filepath, line="second")
+            append_line_if_missing(filepath=filepath, line="first")
+            with open(filepath, encoding="utf-8") as txt_file:
+                self.assertEqual(txt_file.read(), "first\nsecond\n")
+
+    @typechecked
+    def test_append_line_if_missing_in_parallel_workers(self) -> None:
+        """Verifies worker processes that share the file lock do not append
+        the same line twice."""
+        mp_context = multiprocessing.get_context()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath: str = f"{tmp_dir}/hashes.txt"
+            with ProcessPoolExecutor(
+                max_workers=4,
+                mp_context=mp_context,
+                initializer=partial(
+                    set_shared_file_lock, lock=mp_context.Lock()
+                ),
+            ) as executor:
+                for future in [
+                    executor.submit(append_hashes, filepath=filepath)
+                    for _ in range(8)
+                ]:
+                    future.result()
+            with open(filepath, encoding="utf-8") as txt_file:
+                lines = txt_file.read().splitlines()
+            self.assertEqual(sorted(lines), [f"hash_{i}" for i in range(7)])
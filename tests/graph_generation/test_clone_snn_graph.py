@@ -0,0 +1,82 @@
+"""Verifies the clone of an snn graph can be adapted without modifying the
+original snn graph."""
+import unittest
+
+import networkx as nx
+from snnbackends.networkx.LIF_neuron import LIF_neuron, Synapse
+from typeguard import typechecked
+
+from snncompare.graph_generation.stage_1_create_graphs import clone_snn_graph
+
+
+class Test_clone_snn_graph(unittest.TestCase):
+    """Tests whether clone_snn_graph returns an independent copy of an snn
+    graph."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    def setUp(self) -> None:
+        """Creates an snn graph with two nx_lif neurons and a synapse."""
+        self.snn_graph: nx.DiGraph = nx.DiGraph()
+        self.snn_graph.graph["alg_props"] = {"some_prop": [1, 2]}
+        for node_name in ["left", "right"]:
+            self.snn_graph.add_node(
+                node_name,
+                nx_lif=[
+                    LIF_neuron(name=node_name, bias=0.1, du=0.1, dv=0.1, vth=1)
+                ],
+            )
+        self.snn_graph.add_edge(
+            "left",
+            "right",
+            synapse=Synapse(weight=1, delay=1, change_per_t=1),
+            is_redundant=False,
+        )
+
+    @typechecked
+    def test_modifying_clone_leaves_original_unchanged(self) -> None:
+        """Verifies modifying the nx_lif neurons, synapses, graph properties
+        and structure of the clone does not modify the original snn graph."""
+        clone: nx.DiGraph = clone_snn_graph(snn_graph=self.snn_graph)
+
+        clone.nodes["left"]["nx_lif"][0].name = "changed"
+        clone.nodes["left"]["nx_lif"].append(
+            LIF_neuron(name="left", bias=0.2, du=0.2, dv=0.2, vth=2)
+        )
+        clone.edges["left", "right"]["synapse"].weight = 5
+        clone.edges["left", "right"]["is_redundant"] = True
+        clone.graph["alg_props"]["some_prop"].append(3)
+        clone.add_edge("right", "left")
+
+        self.assertEqual(
+            self.snn_graph.nodes["left"]["nx_lif"][0].name, "left"
+        )
+        self.assertEqual(len(self.snn_graph.nodes["left"]["nx_lif"]), 1)
+        self.assertEqual(
+            self.snn_graph.edges["left", "right"]["synapse"].weight, 1
+        )
+        self.assertFalse(self.snn_graph.edges["left", "right"]["is_redundant"])
+        self.assertEqual(
+            self.snn_graph.graph["alg_props"], {"some_prop": [1, 2]}
+        )
+        self.assertFalse(self.snn_graph.has_edge("right", "left"))
+
+    @typechecked
+    def test_clone_shares_objects_that_are_shared_in_original(self) -> None:
+        """Verifies an object that is referenced from multiple attribute dicts
+        of the original snn graph is a single object in the clone."""
+        self.snn_graph.nodes["right"]["nx_lif"] = self.snn_graph.nodes["left"][
+            "nx_lif"
+        ]
+        clone: nx.DiGraph = clone_snn_graph(snn_graph=self.snn_graph)
+
+        self.assertIs(
+            clone.nodes["left"]["nx_lif"], clone.nodes["right"]["nx_lif"]
+        )
+        self.assertIsNot(
+            clone.nodes["left"]["nx_lif"],
+            self.snn_graph.nodes["left"]["nx_lif"],
+        )
@@ -0,0 +1,79 @@
+"""Verifies the cached input graphs are invalidated when their json file
+changes, and that callers can not modify the cached input graphs."""
+import json
+import os
+import tempfile
+import time
+import unittest
+
+import networkx as nx
+from networkx.readwrite import json_graph
+from typeguard import typechecked
+
+from snncompare.graph_generation.export_input_graphs import (
+    load_input_graph_based_on_nr,
+)
+
+
+class Test_load_input_graph_based_on_nr(unittest.TestCase):
+    """Tests whether load_input_graph_based_on_nr returns the current input
+    graph, also when the input graph is cached."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    def setUp(self) -> None:
+        """Outputs an input graph of size 3 in a temporary results
+        directory."""
+        self.cwd: str = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        os.makedirs("results/stage1/input_graphs/3/")
+        self.output_filepath: str = (
+            "results/stage1/input_graphs/3/some_hash.json"
+        )
+        input_graph = nx.path_graph(3)
+        nx.set_node_attributes(input_graph, {0: [1, 2]}, "some_list")
+        self.write_input_graph(input_graph=input_graph)
+
+    def tearDown(self) -> None:
+        """Removes the temporary results directory."""
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def write_input_graph(self, *, input_graph: nx.Graph) -> None:
+        """Writes an input graph to its json file."""
+        with open(self.output_filepath, "w", encoding="utf-8") as json_file:
+            json.dump(json_graph.node_link_data(input_graph), json_file)
+
+    @typechecked
+    def test_rewritten_input_graph_invalidates_cache(self) -> None:
+        """Verifies an input graph that is outputted again after it was cached
+        is loaded again."""
+        load_input_graph_based_on_nr(3, 0)
+        self.write_input_graph(input_graph=nx.complete_graph(3))
+        # Change the modification time, also if the rewrite happened within
+        # the same clock tick.
+        future: float = time.time() + 10
+        os.utime(self.output_filepath, (future, future))
+        self.assertEqual(
+            load_input_graph_based_on_nr(3, 0).number_of_edges(), 3
+        )
+
+    @typechecked
+    def test_caller_cannot_modify_cached_input_graph(self) -> None:
+        """Verifies modifying the graph, node attribute values and edges of a
+        returned input graph does not modify the input graph that is returned
+        on the next call."""
+        input_graph: nx.Graph = load_input_graph_based_on_nr(3, 0)
+        input_graph.graph["alg_props"] = {"some_prop": 1}
+        input_graph.nodes[0]["some_list"].append(3)
+        input_graph.add_edge(0, 2)
+
+        reloaded_graph: nx.Graph = load_input_graph_based_on_nr(3, 0)
+        self.assertNotIn("alg_props", reloaded_graph.graph)
+        self.assertEqual(reloaded_graph.nodes[0]["some_list"], [1, 2])
+        self.assertEqual(reloaded_graph.number_of_edges(), 2)
@@ -0,0 +1,90 @@
+"""Verifies the cached lines of a file are invalidated when the file
+changes."""
+import os
+import tempfile
+import time
+import unittest
+
+from typeguard import typechecked
+
+from snncompare.import_results.helper import (
+    file_contains_line,
+    get_lines_of_file_version,
+)
+
+
+class Test_file_contains_line(unittest.TestCase):
+    """Tests whether file_contains_line returns whether the current content
+    of a file contains a line, also when its lines are cached."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    def setUp(self) -> None:
+        """Creates a file with a single line."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filepath: str = f"{self.tmp_dir.name}/hashes.txt"
+        with open(self.filepath, "w", encoding="utf-8") as txt_file:
+            txt_file.write("first_hash\n")
+
+    def tearDown(self) -> None:
+        """Removes the file."""
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_appended_line_invalidates_lines(self) -> None:
+        """Verifies a line that is appended after the lines were cached is
+        found."""
+        self.assertTrue(
+            file_contains_line(
+                filepath=self.filepath, expected_line="first_hash"
+            )
+        )
+        self.assertFalse(
+            file_contains_line(
+                filepath=self.filepath, expected_line="second_hash"
+            )
+        )
+        with open(self.filepath, "a", encoding="utf-8") as txt_file:
+            txt_file.write("second_hash\n")
+        self.assertTrue(
+            file_contains_line(
+                filepath=self.filepath, expected_line="second_hash"
+            )
+        )
+
+    @typechecked
+    def test_rewritten_file_of_same_size_invalidates_lines(self) -> None:
+        """Verifies a file that is overwritten with content of the same size
+        is read again, because its modification time changed."""
+        file_contains_line(filepath=self.filepath, expected_line="first_hash")
+        with open(self.filepath, "w", encoding="utf-8") as txt_file:
+            txt_file.write("other_hash\n")
+        future: float = time.time() + 10
+        os.utime(self.filepath, (future, future))
+        self.assertFalse(
+            file_contains_line(
+                filepath=self.filepath, expected_line="first_hash"
+            )
+        )
+        self.assertTrue(
+            file_contains_line(
+                filepath=self.filepath, expected_line="other_hash"
+            )
+        )
+
+    @typechecked
+    def test_cached_lines_are_immutable(self) -> None:
+        """Verifies the cached lines are returned as a tuple, which callers
+        cannot modify."""
+        file_stat: os.stat_result = os.stat(self.filepath)
+        lines = get_lines_of_file_version(
+            filepath=self.filepath,
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+        )
+        self.assertEqual(lines, ("first_hash\n",))
+        with self.assertRaises(TypeError):
+            lines[0] = "modified_hash\n"  # type: ignore[index]
@@ -0,0 +1,91 @@
+"""Verifies the cached directory listing is invalidated when a file is added
+to or removed from the directory."""
+import os
+import tempfile
+import time
+import unittest
+
+from typeguard import typechecked
+
+from snncompare.import_results.helper import (
+    DIR_LISTING_CACHE,
+    get_filenames_in_dir,
+)
+
+
+class Test_get_filenames_in_dir(unittest.TestCase):
+    """Tests whether get_filenames_in_dir returns the current files of a
+    directory, also when its listing is cached."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    def setUp(self) -> None:
+        """Creates a directory with one file and a subdirectory, which was
+        last modified long enough ago for its listing to be cached."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dirpath: str = self.tmp_dir.name
+        with open(f"{self.dirpath}/a.json", "w", encoding="utf-8"):
+            pass
+        os.mkdir(f"{self.dirpath}/subdir")
+        self.set_dir_mtime_to_the_past()
+
+    def tearDown(self) -> None:
+        """Removes the directory and its cached listing."""
+        DIR_LISTING_CACHE.pop(self.dirpath, None)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def set_dir_mtime_to_the_past(self) -> None:
+        """Sets the modification time of the directory 10 seconds back."""
+        past: float = time.time() - 10
+        os.utime(self.dirpath, (past, past))
+
+    @typechecked
+    def test_listing_is_cached_and_contains_only_files(self) -> None:
+        """Verifies the listing of an unmodified directory is cached, and that
+        it does not contain the subdirectory."""
+        self.assertEqual(
+            get_filenames_in_dir(dirpath=self.dirpath), ["a.json"]
+        )
+        self.assertIn(self.dirpath, DIR_LISTING_CACHE)
+
+    @typechecked
+    def test_added_file_invalidates_listing(self) -> None:
+        """Verifies a file that is added after the listing was cached is
+        returned."""
+        get_filenames_in_dir(dirpath=self.dirpath)
+        with open(f"{self.dirpath}/b.json", "w", encoding="utf-8"):
+            pass
+        self.assertEqual(
+            sorted(get_filenames_in_dir(dirpath=self.dirpath)),
+            ["a.json", "b.json"],
+        )
+
+    @typechecked
+    def test_removed_file_invalidates_listing(self) -> None:
+        """Verifies a file that is removed after the listing was cached is no
+        longer returned."""
+        get_filenames_in_dir(dirpath=self.dirpath)
+        os.remove(f"{self.dirpath}/a.json")
+        self.assertEqual(get_filenames_in_dir(dirpath=self.dirpath), [])
+
+    @typechecked
+    def test_recently_modified_dir_is_not_cached(self) -> None:
+        """Verifies a directory that was modified in the last second is listed
+        again, because a file added in the same second may not change its
+        modification time."""
+        os.utime(self.dirpath)
+        get_filenames_in_dir(dirpath=self.dirpath)
+        self.assertNotIn(self.dirpath, DIR_LISTING_CACHE)
+
+    @typechecked
+    def test_caller_cannot_modify_cached_listing(self) -> None:
+        """Verifies modifying a returned listing does not modify the cached
+        listing."""
+        get_filenames_in_dir(dirpath=self.dirpath).append("modified.json")
+        self.assertEqual(
+            get_filenames_in_dir(dirpath=self.dirpath), ["a.json"]
+        )
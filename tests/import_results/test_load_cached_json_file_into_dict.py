@@ -0,0 +1,69 @@
+"""Verifies the cached json file content is invalidated when the file changes,
+and that callers can not modify the cached content."""
+import json
+import os
+import tempfile
+import time
+import unittest
+from typing import Dict
+
+from typeguard import typechecked
+
+from snncompare.import_results.read_json import (
+    load_cached_json_file_into_dict,
+)
+
+
+class Test_load_cached_json_file_into_dict(unittest.TestCase):
+    """Tests whether load_cached_json_file_into_dict returns the current
+    content of a json file, also when its content is cached."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    def setUp(self) -> None:
+        """Creates a json file with a synapse, like the stage 1 snn files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.json_filepath: str = f"{self.tmp_dir.name}/snn.json"
+        self.write_json(some_dict={"synapses": [{"ID": ["a", "b"], "w": 1.0}]})
+
+    def tearDown(self) -> None:
+        """Removes the json file."""
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def write_json(self, *, some_dict: Dict) -> None:
+        """Writes a dict to the json file."""
+        with open(self.json_filepath, "w", encoding="utf-8") as json_file:
+            json.dump(some_dict, json_file)
+
+    @typechecked
+    def test_rewritten_file_invalidates_content(self) -> None:
+        """Verifies a file that is overwritten after its content was cached is
+        read again."""
+        load_cached_json_file_into_dict(json_filepath=self.json_filepath)
+        self.write_json(some_dict={"synapses": [{"ID": ["a", "c"], "w": 2.0}]})
+        # Change the modification time, also if the rewrite happened within
+        # the same clock tick.
+        future: float = time.time() + 20
+        os.utime(self.json_filepath, (future, future))
+        self.assertEqual(
+            load_cached_json_file_into_dict(json_filepath=self.json_filepath),
+            {"synapses": [{"ID": ["a", "c"], "w": 2.0}]},
+        )
+
+    @typechecked
+    def test_caller_cannot_modify_cached_content(self) -> None:
+        """Verifies modifying the synapse ID list of a returned dict does not
+        modify the dict that is returned on the next call."""
+        first_dict: Dict = load_cached_json_file_into_dict(
+            json_filepath=self.json_filepath
+        )
+        first_dict["synapses"][0]["ID"].append("c")
+        first_dict["synapses"].append({"ID": ["b", "a"], "w": 1.0})
+        self.assertEqual(
+            load_cached_json_file_into_dict(json_filepath=self.json_filepath),
+            {"synapses": [{"ID": ["a", "b"], "w": 1.0}]},
+        )
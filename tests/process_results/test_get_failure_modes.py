@@ -0,0 +1,130 @@
+"""Verifies the failure modes are extracted correctly from the spike and
+current arrays of a radiated and unradiated SNN."""
+import unittest
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.process_results.get_failure_modes import (
+    compare_spike_behaviour,
+    get_neuron_names_per_timestep,
+)
+
+
+class Test_get_failure_modes(unittest.TestCase):
+    """Tests whether compare_spike_behaviour returns the neuron names per
+    timestep of each failure mode."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.neuron_names: list[str] = ["a", "b", "c"]
+        # Arrays have shape [timesteps, neurons].
+        self.unradiated_spikes: np.ndarray = np.array(
+            [[True, False, False], [False, True, False], [False, False, True]]
+        )
+        self.unradiated_I: np.ndarray = np.array(
+            [[0.0, 1.0, 2.0], [1.0, 1.0, 1.0], [2.0, 0.0, 0.0]]
+        )
+
+    @typechecked
+    def test_incorrectly_spikes_and_silent(self) -> None:
+        """Verifies a neuron that spikes while it should be silent, and a
+        neuron that is silent while it should spike, are stored at the right
+        timesteps."""
+        radiated_spikes: np.ndarray = np.array(
+            [[True, True, False], [False, False, False], [False, False, True]]
+        )
+        (
+            incorrectly_spikes,
+            incorrectly_silent,
+            excitatory_delta_u,
+            inhibitory_delta_u,
+        ) = compare_spike_behaviour(
+            neuron_names=self.neuron_names,
+            radiated_I=self.unradiated_I,
+            radiated_spikes=radiated_spikes,
+            unradiated_I=self.unradiated_I,
+            unradiated_spikes=self.unradiated_spikes,
+        )
+        self.assertEqual(incorrectly_spikes, {0: ["b"]})
+        self.assertEqual(incorrectly_silent, {1: ["b"]})
+        self.assertEqual(excitatory_delta_u, {})
+        self.assertEqual(inhibitory_delta_u, {})
+
+    @typechecked
+    def test_excitatory_and_inhibitory_delta_u(self) -> None:
+        """Verifies a higher radiated current is excitatory, and a lower
+        radiated current is inhibitory."""
+        radiated_I: np.ndarray = np.array(
+            [[0.5, 1.0, 2.0], [1.0, 0.0, 3.0], [2.0, 0.0, 0.0]]
+        )
+        (
+            incorrectly_spikes,
+            incorrectly_silent,
+            excitatory_delta_u,
+            inhibitory_delta_u,
+        ) = compare_spike_behaviour(
+            neuron_names=self.neuron_names,
+            radiated_I=radiated_I,
+            radiated_spikes=self.unradiated_spikes,
+            unradiated_I=self.unradiated_I,
+            unradiated_spikes=self.unradiated_spikes,
+        )
+        self.assertEqual(incorrectly_spikes, {})
+        self.assertEqual(incorrectly_silent, {})
+        self.assertEqual(excitatory_delta_u, {0: ["a"], 1: ["c"]})
+        self.assertEqual(inhibitory_delta_u, {1: ["b"]})
+
+    @typechecked
+    def test_unequal_durations_compare_the_shared_timesteps(self) -> None:
+        """Verifies only the timesteps that are stored for both SNNs are
+        compared if the simulation durations differ."""
+        radiated_spikes: np.ndarray = np.array([[False, False, False]])
+        radiated_I: np.ndarray = np.array([[0.0, 1.0, 3.0]])
+        (
+            incorrectly_spikes,
+            incorrectly_silent,
+            excitatory_delta_u,
+            inhibitory_delta_u,
+        ) = compare_spike_behaviour(
+            neuron_names=self.neuron_names,
+            radiated_I=radiated_I,
+            radiated_spikes=radiated_spikes,
+            unradiated_I=self.unradiated_I,
+            unradiated_spikes=self.unradiated_spikes,
+        )
+        self.assertEqual(incorrectly_spikes, {})
+        self.assertEqual(incorrectly_silent, {0: ["a"]})
+        self.assertEqual(excitatory_delta_u, {0: ["c"]})
+        self.assertEqual(inhibitory_delta_u, {})
+
+    @typechecked
+    def test_empty_radiated_arrays_have_no_failures(self) -> None:
+        """Verifies an empty radiated array is compared without a shape
+        mismatch, and results in no failures."""
+        self.assertEqual(
+            compare_spike_behaviour(
+                neuron_names=self.neuron_names,
+                radiated_I=np.array([]),
+                radiated_spikes=np.array([]),
+                unradiated_I=self.unradiated_I,
+                unradiated_spikes=self.unradiated_spikes,
+            ),
+            ({}, {}, {}, {}),
+        )
+
+    @typechecked
+    def test_neuron_names_are_sorted_per_timestep(self) -> None:
+        """Verifies the neuron names are stored sorted, per timestep at which
+        the mask is True for at least one neuron."""
+        self.assertEqual(
+            get_neuron_names_per_timestep(
+                neuron_mask=np.array(
+                    [[False, True, True], [False, False, False]]
+                ),
+                neuron_names=["z", "b", "a"],
+            ),
+            {0: ["a", "b"]},
+        )
@@ -0,0 +1,138 @@
+"""Verifies the parallel runs of an experiment are checkpointed as they
+finish, and that a failed run raises an error after the other runs are
+checkpointed."""
+# pylint: disable=W0212
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from typeguard import typechecked
+
+from snncompare.arg_parser.arg_parser import parse_cli_args
+from snncompare.arg_parser.process_args import manage_export_parsing
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.Experiment_runner import Experiment_runner
+from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.optional_config.Output_config import Output_config
+from snncompare.progress_report.run_checkpoint import (
+    load_completed_run_config_ids,
+)
+from snncompare.run_config.Run_config import Run_config
+
+# The unique ids of the run configs that fail in the worker processes. The
+# forked workers inherit it.
+FAILING_RUN_CONFIG_IDS: list[str] = []
+
+
+@typechecked
+def perform_run_in_fake_worker(
+    run_config: Run_config,
+    exp_config: Exp_config,
+    output_config: Output_config,
+    plot_config: Plot_config,
+) -> str:
+    """Replaces perform_run_in_worker, such that the runs are not actually
+    performed."""
+    if run_config.unique_id in FAILING_RUN_CONFIG_IDS:
+        raise ValueError(f"Error, run config:{run_config.unique_id} failed.")
+    return run_config.unique_id
+
+
+@unittest.skipUnless(
+    "fork" in multiprocessing.get_all_start_methods(),
+    "The fake worker is only inherited by forked worker processes.",
+)
+class Test_parallel_runs(unittest.TestCase):
+    """Tests whether the parallel branch of Experiment_runner checkpoints the
+    completed runs and raises on a failed run."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.custom_config_path: str = (
+            f"{os.getcwd()}/src/snncompare/json_configurations/"
+        )
+
+    def setUp(self) -> None:
+        """Performs the experiment in a temporary directory, such that its
+        output and checkpoint do not remain."""
+        self.original_cwd: str = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.exp_config: Exp_config = load_exp_config_from_file(
+            custom_config_path=self.custom_config_path,
+            filename="quicktest",
+        )
+        mock_args = parse_cli_args(parse=False).parse_args(
+            ["-e", "quicktest", "-pr", "2"]
+        )
+        self.output_config: Output_config = manage_export_parsing(
+            args=mock_args
+        )
+        self.exp_runner = Experiment_runner(
+            exp_config=self.exp_config,
+            output_config=self.output_config,
+            reverse=False,
+            perform_run=False,
+        )
+        self.assertGreater(len(self.exp_runner.run_configs), 1)
+
+    def tearDown(self) -> None:
+        """Returns to the original working directory."""
+        FAILING_RUN_CONFIG_IDS.clear()
+        os.chdir(self.original_cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def perform_parallel_run(self) -> None:
+        """Performs the runs of the experiment with the fake worker."""
+        self.assertTrue(
+            self.exp_runner.performs_runs_in_parallel(
+                output_config=self.output_config,
+                run_configs=self.exp_runner.run_configs,
+            )
+        )
+        with mock.patch(
+            "snncompare.Experiment_runner.perform_run_in_worker",
+            perform_run_in_fake_worker,
+        ):
+            self.exp_runner._Experiment_runner__perform_run(
+                exp_config=self.exp_config,
+                output_config=self.output_config,
+                run_configs=self.exp_runner.run_configs,
+            )
+
+    @typechecked
+    def test_parallel_runs_are_checkpointed(self) -> None:
+        """Verifies all parallel runs are stored in the checkpoint."""
+        self.perform_parallel_run()
+        self.assertEqual(
+            sorted(load_completed_run_config_ids(exp_config=self.exp_config)),
+            sorted(
+                run_config.unique_id
+                for run_config in self.exp_runner.run_configs
+            ),
+        )
+
+    @typechecked
+    def test_failed_run_raises_after_checkpointing_the_others(self) -> None:
+        """Verifies a failed run raises an error, and that the other runs are
+        checkpointed before it is raised."""
+        failing_id: str = self.exp_runner.run_configs[0].unique_id
+        FAILING_RUN_CONFIG_IDS.append(failing_id)
+
+        with self.assertRaises(RuntimeError) as context:
+            self.perform_parallel_run()
+        self.assertIn(failing_id, str(context.exception))
+        self.assertEqual(
+            sorted(load_completed_run_config_ids(exp_config=self.exp_config)),
+            sorted(
+                run_config.unique_id
+                for run_config in self.exp_runner.run_configs[1:]
+            ),
+        )
@@ -0,0 +1,118 @@
+"""Verifies an experiment resumes from its checkpoint, and ignores the
+checkpoint if its runs have to be performed again."""
+import os
+import tempfile
+import unittest
+
+from typeguard import typechecked
+
+from snncompare.arg_parser.arg_parser import parse_cli_args
+from snncompare.arg_parser.process_args import manage_export_parsing
+from snncompare.create_configs import generate_run_configs
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.optional_config.Output_config import Output_config
+from snncompare.progress_report.run_checkpoint import (
+    get_run_configs_to_perform,
+    load_completed_run_config_ids,
+    store_completed_run_config_ids,
+)
+
+
+class Test_run_checkpoint(unittest.TestCase):
+    """Tests whether the completed run configs of a checkpoint are skipped
+    when an experiment is resumed."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.exp_config: Exp_config = load_exp_config_from_file(
+            custom_config_path="src/snncompare/json_configurations/",
+            filename="quicktest",
+        )
+        self.run_configs = generate_run_configs(exp_config=self.exp_config)
+
+    @typechecked
+    def get_output_config(self, *, cli_args: list[str]) -> Output_config:
+        """Returns the output config of the quicktest experiment with the
+        given extra command line arguments."""
+        mock_args = parse_cli_args(parse=False).parse_args(
+            ["-e", "quicktest"] + cli_args
+        )
+        return manage_export_parsing(args=mock_args)
+
+    @typechecked
+    def resume_from_checkpoint(
+        self, *, output_config: Output_config
+    ) -> list[str]:
+        """Stores the first run config as completed in a checkpoint in a
+        temporary directory, and returns the unique ids of the run configs
+        that are performed when the experiment is resumed."""
+        original_cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                store_completed_run_config_ids(
+                    completed_run_config_ids=[self.run_configs[0].unique_id],
+                    exp_config=self.exp_config,
+                )
+                run_configs = get_run_configs_to_perform(
+                    completed_run_config_ids=load_completed_run_config_ids(
+                        exp_config=self.exp_config
+                    ),
+                    output_config=output_config,
+                    run_configs=self.run_configs,
+                )
+            finally:
+                os.chdir(original_cwd)
+        return [run_config.unique_id for run_config in run_configs]
+
+    @typechecked
+    def test_resume_skips_completed_run_configs(self) -> None:
+        """Verifies the completed run config is skipped with -scr."""
+        performed_ids = self.resume_from_checkpoint(
+            output_config=self.get_output_config(cli_args=["-scr"])
+        )
+        self.assertEqual(
+            performed_ids,
+            [run_config.unique_id for run_config in self.run_configs[1:]],
+        )
+
+    @typechecked
+    def test_without_flag_performs_all_run_configs(self) -> None:
+        """Verifies no run config is skipped without -scr."""
+        performed_ids = self.resume_from_checkpoint(
+            output_config=self.get_output_config(cli_args=[])
+        )
+        self.assertEqual(
+            performed_ids,
+            [run_config.unique_id for run_config in self.run_configs],
+        )
+
+    @typechecked
+    def test_recreated_stages_ignore_checkpoint(self) -> None:
+        """Verifies the checkpoint is ignored if stages are recreated, because
+        the completed run configs have to be performed again."""
+        performed_ids = self.resume_from_checkpoint(
+            output_config=self.get_output_config(cli_args=["-scr", "-r4"])
+        )
+        self.assertEqual(
+            performed_ids,
+            [run_config.unique_id for run_config in self.run_configs],
+        )
+
+    @typechecked
+    def test_missing_checkpoint_loads_no_run_configs(self) -> None:
+        """Verifies an experiment without checkpoint has no completed run
+        configs."""
+        original_cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                self.assertEqual(
+                    load_completed_run_config_ids(exp_config=self.exp_config),
+                    [],
+                )
+            finally:
+                os.chdir(original_cwd)